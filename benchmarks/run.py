@@ -0,0 +1,346 @@
+"""Que Cast benchmark and soak-test runner.
+
+Usage (from the repository root, with Home Assistant installed)::
+
+    python -m benchmarks.run                     # all scenarios
+    python -m benchmarks.run -s latency -s ducking
+    python -m benchmarks.run --soak 300 --output bench_output.txt
+
+Each scenario prints one JSON object per line, so results can be diffed or
+collected across commits to track regressions.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from .simulated_home import SimulatedHome
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 3)
+
+    return {
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+    }
+
+
+async def bench_enqueue_throughput(items: int = 5000) -> dict:
+    """Enqueue rate while the worker is busy with one long message."""
+    home = SimulatedHome()
+    await home.async_setup()
+    home.add_player("media_player.target", playback_s=3600)
+    manager = await home.async_add_instance("media_player.target")
+    rng = random.Random(1)
+    try:
+        start = perf_counter()
+        for i in range(items):
+            await manager.enqueue_speak(f"message {i}", priority=rng.randint(-5, 5))
+        elapsed = perf_counter() - start
+        return {
+            "items": items,
+            "seconds": round(elapsed, 4),
+            "ops_per_s": round(items / elapsed),
+            "queue_size": manager.queue_size,
+        }
+    finally:
+        await home.async_close()
+
+
+async def bench_overflow(items: int = 10000, max_queue_size: int = 100) -> dict:
+    """Runaway automation against a bounded queue; depth must stay at the limit."""
+    home = SimulatedHome()
+    await home.async_setup()
+    home.add_player("media_player.target", playback_s=3600)
+    manager = await home.async_add_instance(
+        "media_player.target", max_queue_size=max_queue_size, message_ttl_s=60
+    )
+    rng = random.Random(4)
+    try:
+        start = perf_counter()
+        for i in range(items):
+            await manager.enqueue_speak(f"spam {i}", priority=rng.randint(-5, 5))
+        elapsed = perf_counter() - start
+        return {
+            "items": items,
+            "seconds": round(elapsed, 4),
+            "ops_per_s": round(items / elapsed),
+            "queue_size": manager.queue_size,
+            "dropped": manager.stats.counters["dropped"],
+            "rejected": manager.stats.counters["rejected"],
+        }
+    finally:
+        await home.async_close()
+
+
+async def bench_latency(samples: int = 200) -> dict:
+    """Time from enqueue on an idle instance to the TTS call reaching the player."""
+    home = SimulatedHome()
+    await home.async_setup()
+    player = home.add_player("media_player.target", playback_s=0.001)
+    manager = await home.async_add_instance("media_player.target", ducking_enabled=False)
+    latencies = []
+    try:
+        for i in range(samples):
+            before = len(player.plays)
+            start = perf_counter()
+            await manager.enqueue_speak(f"message {i}")
+            while len(player.plays) == before:
+                await asyncio.sleep(0)
+            latencies.append(player.plays[-1][0] - start)
+            await home.async_drain()
+        return {"samples": samples, **_percentiles(latencies)}
+    finally:
+        await home.async_close()
+
+
+async def bench_burst(items: int = 300, interrupt_ratio: float = 0.05) -> dict:
+    """Mixed-priority burst with interrupts; drain time and priority inversions."""
+    home = SimulatedHome()
+    await home.async_setup()
+    player = home.add_player("media_player.target", playback_s=0.002)
+    manager = await home.async_add_instance("media_player.target", ducking_enabled=False)
+    rng = random.Random(2)
+    priorities = {}
+    interrupting = set()
+    try:
+        start = perf_counter()
+        for i in range(items):
+            message = f"burst {i}"
+            priorities[message] = rng.randint(-3, 3)
+            interrupt = rng.random() < interrupt_ratio
+            if interrupt:
+                interrupting.add(message)
+            await manager.enqueue_speak(message, priority=priorities[message], interrupt=interrupt)
+        drained = await home.async_drain()
+        elapsed = perf_counter() - start
+
+        # Messages may be batched or coalesced; count what reached the player.
+        # Interrupting messages jump the queue by design.
+        played = [message for _, message in player.plays if message in priorities]
+        inversions = sum(
+            1
+            for earlier, later in zip(played, played[1:])
+            if priorities[later] > priorities[earlier] and earlier not in interrupting
+        )
+        return {
+            "items": items,
+            "drained": drained,
+            "seconds": round(elapsed, 4),
+            "played": len(played),
+            "priority_inversions": inversions,
+        }
+    finally:
+        await home.async_close()
+
+
+async def bench_interrupt(samples: int = 10, tts_latency_ms: float = 300.0) -> dict:
+    """Enqueue-to-TTS-call latency of interrupts arriving during a slow TTS call.
+
+    Run with the interrupt above the queued routine items and at their
+    priority; either way it must not wait behind them.
+    """
+    return {
+        "samples": samples,
+        "tts_latency_ms": tts_latency_ms,
+        "interrupt": await _interrupt_latency(samples, tts_latency_ms, priority=10),
+        "interrupt_same_priority": await _interrupt_latency(samples, tts_latency_ms, priority=0),
+    }
+
+
+async def _interrupt_latency(samples: int, tts_latency_ms: float, priority: int) -> dict:
+    home = SimulatedHome(tts_latency_s=tts_latency_ms / 1000.0)
+    await home.async_setup()
+    home.add_player("media_player.target", playback_s=0.05)
+    manager = await home.async_add_instance("media_player.target", ducking_enabled=False)
+    try:
+        for i in range(samples):
+            await manager.enqueue_speak(f"routine {i}")
+            await manager.enqueue_speak(f"routine {i} queued")
+            # Let the routine item get stuck in its TTS call
+            await asyncio.sleep(0.02)
+            await manager.enqueue_speak(f"urgent {i}", priority=priority, interrupt=True)
+            await home.async_drain()
+        return manager.stats.percentiles("interrupt")
+    finally:
+        await home.async_close()
+
+
+async def bench_ducking(
+    players: int = 15, idle_players: int = 200, call_latency_ms: float = 20.0, samples: int = 20
+) -> dict:
+    """Enqueue-to-audio latency with N other players playing and needing ducking, among idle ones."""
+    home = SimulatedHome()
+    await home.async_setup()
+    target = home.add_player("media_player.target", playback_s=0.001)
+    for i in range(players):
+        home.add_player(
+            f"media_player.other_{i}",
+            playing=True,
+            volume=0.3 + 0.05 * (i % 10),
+            call_latency_s=call_latency_ms / 1000.0,
+        )
+    for i in range(idle_players):
+        home.add_player(f"media_player.idle_{i}")
+    manager = await home.async_add_instance("media_player.target")
+    latencies = []
+    try:
+        for i in range(samples):
+            before = len(target.plays)
+            start = perf_counter()
+            await manager.enqueue_speak(f"duck {i}")
+            while len(target.plays) == before:
+                await asyncio.sleep(0.001)
+            latencies.append(target.plays[-1][0] - start)
+            await home.async_drain()
+        return {"players": players, "idle_players": idle_players, "call_latency_ms": call_latency_ms, **_percentiles(latencies)}
+    finally:
+        await home.async_close()
+
+
+async def bench_instances(instances: int = 20, items: int = 20) -> dict:
+    """Drain time and event-loop lag with many instances working at once."""
+    home = SimulatedHome()
+    await home.async_setup()
+    managers = []
+    for i in range(instances):
+        home.add_player(f"media_player.room_{i}", playback_s=0.002)
+    for i in range(instances):
+        managers.append(
+            await home.async_add_instance(f"media_player.room_{i}", ducking_enabled=False)
+        )
+
+    lags = []
+    stop = asyncio.Event()
+
+    async def probe() -> None:
+        loop = asyncio.get_running_loop()
+        while not stop.is_set():
+            start = loop.time()
+            await asyncio.sleep(0.001)
+            lags.append(loop.time() - start - 0.001)
+
+    try:
+        probe_task = asyncio.create_task(probe())
+        start = perf_counter()
+        for i in range(items):
+            for manager in managers:
+                await manager.enqueue_speak(f"room message {i}")
+        drained = await home.async_drain()
+        elapsed = perf_counter() - start
+        stop.set()
+        await probe_task
+        return {
+            "instances": instances,
+            "items_per_instance": items,
+            "drained": drained,
+            "seconds": round(elapsed, 4),
+            "loop_lag": _percentiles(lags),
+        }
+    finally:
+        await home.async_close()
+
+
+async def soak(seconds: float) -> dict:
+    """Random sustained load; reports latency, throughput and memory growth."""
+    home = SimulatedHome()
+    await home.async_setup()
+    rooms = 4
+    for i in range(rooms):
+        home.add_player(f"media_player.room_{i}", playback_s=0.005)
+    for i in range(6):
+        home.add_player(f"media_player.music_{i}", playing=True, call_latency_s=0.002)
+    managers = [await home.async_add_instance(f"media_player.room_{i}") for i in range(rooms)]
+    rng = random.Random(3)
+
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + seconds
+    enqueued = 0
+    try:
+        while loop.time() < deadline:
+            manager = rng.choice(managers)
+            await manager.enqueue_speak(
+                rng.choice(["Front door open", "Laundry done", "Motion in garage", f"Event {enqueued}"]),
+                priority=rng.randint(-2, 5),
+                interrupt=rng.random() < 0.01,
+            )
+            enqueued += 1
+            await asyncio.sleep(rng.expovariate(200))
+        drained = await home.async_drain()
+        current = tracemalloc.take_snapshot()
+        growth = sum(stat.size_diff for stat in current.compare_to(baseline, "filename"))
+        played = sum(len(home.players[f"media_player.room_{i}"].plays) for i in range(rooms))
+        return {
+            "seconds": seconds,
+            "enqueued": enqueued,
+            "played": played,
+            "drained": drained,
+            "memory_growth_kib": round(growth / 1024, 1),
+        }
+    finally:
+        tracemalloc.stop()
+        await home.async_close()
+
+
+SCENARIOS: dict[str, Callable[[], Awaitable[dict]]] = {
+    "enqueue_throughput": bench_enqueue_throughput,
+    "overflow": bench_overflow,
+    "latency": bench_latency,
+    "burst": bench_burst,
+    "interrupt": bench_interrupt,
+    "ducking": bench_ducking,
+    "instances": bench_instances,
+}
+
+
+async def _run(names: list[str], soak_seconds: float, output) -> None:
+    for name in names:
+        result = await SCENARIOS[name]()
+        _emit(output, name, result)
+    if soak_seconds:
+        _emit(output, "soak", await soak(soak_seconds))
+
+
+def _emit(output, name: str, result: dict) -> None:
+    line = json.dumps({"scenario": name, "time": int(time.time()), **result})
+    output.write(line + "\n")
+    output.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--soak", type=float, default=0, help="run the soak test for N seconds")
+    parser.add_argument("--output", help="append JSON lines to this file instead of stdout")
+    args = parser.parse_args()
+
+    names = args.scenario or list(SCENARIOS)
+    output = open(args.output, "a", encoding="utf-8") if args.output else sys.stdout
+    try:
+        asyncio.run(_run(names, args.soak, output))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
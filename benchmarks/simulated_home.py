@@ -0,0 +1,159 @@
+"""Simulated Home Assistant with media players for Que Cast benchmarks.
+
+Everything runs in-process on a bare Home Assistant core (service registry,
+state machine, event bus) with no integrations loaded and no network.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+from time import perf_counter
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "custom_components"))
+
+from homeassistant.core import HomeAssistant, ServiceCall  # noqa: E402
+
+from que_cast.queue_manager import QueCastQueueManager  # noqa: E402
+
+TTS_ENGINE = "tts.sim_say"
+
+# Everything that touches disk or the TTS media source is off, and the
+# queue is unbounded, so the benchmarks measure the queue itself
+BASE_CONFIG = {
+    "tts_engine": TTS_ENGINE,
+    "lookahead": 0,
+    "cache_max_entries": 0,
+    "persist_queue": False,
+    "pre_roll_ms": 0,
+    "post_grace_ms": 0,
+    "detection_mode": "state",
+    "max_queue_size": 0,
+}
+
+
+class SimulatedPlayer:
+    """A media player that plays for a fixed time after a configurable call latency."""
+
+    def __init__(
+        self,
+        home: SimulatedHome,
+        entity_id: str,
+        playback_s: float = 0.02,
+        call_latency_s: float = 0.0,
+        playing: bool = False,
+        volume: float = 0.5,
+    ):
+        self._home = home
+        self.entity_id = entity_id
+        self.playback_s = playback_s
+        self.call_latency_s = call_latency_s
+        self.volume = volume
+        self.state = "playing" if playing else "idle"
+        # (perf_counter, service, message) for every call this player handled
+        self.calls: list[tuple[float, str, Optional[str]]] = []
+        self.plays: list[tuple[float, Optional[str]]] = []
+        self._end_handle: Optional[asyncio.TimerHandle] = None
+        self._publish()
+
+    def _publish(self, **extra) -> None:
+        attributes = {"volume_level": self.volume, **extra}
+        self._home.hass.states.async_set(self.entity_id, self.state, attributes)
+
+    async def async_handle(self, service: str, data: dict) -> None:
+        if self.call_latency_s:
+            await asyncio.sleep(self.call_latency_s)
+        now = perf_counter()
+        message = data.get("message") or data.get("media_content_id")
+        self.calls.append((now, service, message))
+        if service == "volume_set":
+            self.volume = data["volume_level"]
+            self._publish()
+        elif service in ("play_media", "say"):
+            self.plays.append((now, message))
+            self._start(message)
+        elif service == "media_stop":
+            self._stop()
+
+    def _start(self, message: Optional[str]) -> None:
+        if self._end_handle is not None:
+            self._end_handle.cancel()
+        self.state = "playing"
+        self._publish(media_duration=self.playback_s, media_title=message)
+        self._end_handle = self._home.hass.loop.call_later(self.playback_s, self._stop)
+
+    def _stop(self) -> None:
+        if self._end_handle is not None:
+            self._end_handle.cancel()
+            self._end_handle = None
+        self.state = "idle"
+        self._publish()
+
+
+class SimulatedHome:
+    """Bare Home Assistant core plus simulated players and a simulated TTS engine."""
+
+    def __init__(self, tts_latency_s: float = 0.0) -> None:
+        self._config_dir = tempfile.TemporaryDirectory()
+        # Time the simulated TTS engine takes before the audio reaches the player
+        self.tts_latency_s = tts_latency_s
+        self.hass = HomeAssistant(self._config_dir.name)
+        self.players: dict[str, SimulatedPlayer] = {}
+        self.managers: list[QueCastQueueManager] = []
+
+    async def async_setup(self) -> None:
+        for service in ("volume_set", "play_media", "media_stop"):
+            self.hass.services.async_register("media_player", service, self._async_media_player_call)
+        self.hass.services.async_register("tts", "sim_say", self._async_tts_call)
+
+    def add_player(self, entity_id: str, **kwargs) -> SimulatedPlayer:
+        player = SimulatedPlayer(self, entity_id, **kwargs)
+        self.players[entity_id] = player
+        return player
+
+    async def async_add_instance(self, media_player: str, **config) -> QueCastQueueManager:
+        instance_id = f"bench_{len(self.managers)}"
+        manager = QueCastQueueManager(
+            self.hass, instance_id, {**BASE_CONFIG, "media_player": media_player, **config}
+        )
+        await manager.async_load()
+        await manager.async_start()
+        self.managers.append(manager)
+        return manager
+
+    async def _async_media_player_call(self, call: ServiceCall) -> None:
+        await self._async_dispatch(call.service, call.data)
+
+    async def _async_tts_call(self, call: ServiceCall) -> None:
+        if self.tts_latency_s:
+            await asyncio.sleep(self.tts_latency_s)
+        await self._async_dispatch("say", call.data)
+
+    async def _async_dispatch(self, service: str, data: dict) -> None:
+        entity_ids = data.get("entity_id") or data.get("media_player_entity_id")
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        await asyncio.gather(
+            *(self.players[entity_id].async_handle(service, data) for entity_id in entity_ids)
+        )
+
+    async def async_drain(self, timeout: float = 60.0) -> bool:
+        """Wait until every instance has an empty queue and idle player."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            busy = any(
+                manager.queue_size or manager.is_playing for manager in self.managers
+            )
+            if not busy:
+                return True
+            await asyncio.sleep(0.005)
+        return False
+
+    async def async_close(self) -> None:
+        for manager in self.managers:
+            await manager.async_stop()
+        await self.hass.async_stop(force=True)
+        self._config_dir.cleanup()
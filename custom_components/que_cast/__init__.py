@@ -2,21 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 
+from .audio_cache import async_remove_cache
+from .broadcast import QueCastBroadcast, instances_in_area
 from .const import DOMAIN
+from .plan import parse_options
 from .queue_manager import QueCastQueueManager
+from .storage import QueCastQueueStore
+from .trace import TRACE_SIZE
+from .views import QueCastAudioView
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORMS = ["sensor", "binary_sensor", "button"]
+
+
+def _json_options(value: Any) -> str:
+    """Validate TTS options given as a JSON object string."""
+    value = cv.string(value)
+    try:
+        parse_options(value)
+    except ValueError as err:
+        raise vol.Invalid(str(err)) from err
+    return value
+
+
+# Per-message fields shared by speak and the items of speak_batch
+MESSAGE_FIELDS = {
+    vol.Required("message"): str,
+    vol.Optional("language"): str,
+    vol.Optional("options"): _json_options,
+    vol.Optional("interrupt", default=False): bool,
+    vol.Optional("priority", default=0): int,
+    vol.Optional("volume_override"): vol.All(vol.Coerce(float), vol.Range(0.0, 1.0)),
+    vol.Optional("pre_roll_ms"): int,
+    vol.Optional("ttl_s"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+}
+
+
+def _message_kwargs(data: dict) -> dict:
+    """Map validated message fields to enqueue_speak arguments."""
+    return {
+        "message": data["message"],
+        "language": data.get("language", ""),
+        "options": data.get("options", "{}"),
+        "interrupt": data.get("interrupt", False),
+        "priority": data.get("priority", 0),
+        "volume": data.get("volume_override"),
+        "pre_roll": data.get("pre_roll_ms"),
+        "ttl": data.get("ttl_s"),
+    }
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Que Cast integration (YAML not used)."""
     hass.data.setdefault(DOMAIN, {})
+    hass.http.register_view(QueCastAudioView(hass))
     await _async_register_services(hass)
     return True
 
@@ -24,73 +74,206 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a config entry."""
     instance_id = entry.entry_id
-    config = entry.data
-
-    media_player = config.get("media_player")
-    if not hass.states.get(media_player):
-        _LOGGER.error("Media player %s not found", media_player)
-        return False
+    # Values saved through Options override those from the initial setup
+    config = {**entry.data, **entry.options}
 
     queue_manager = QueCastQueueManager(hass, instance_id, config)
+
+    async def _async_start() -> None:
+        await queue_manager.async_load()
+        await queue_manager.async_start()
+
+    # Restoring the queue and waiting for the media player, which may still be
+    # being discovered, happen in the background so startup is not held up;
+    # messages sent meanwhile are queued
+    start_task = entry.async_create_background_task(
+        hass, _async_start(), f"que_cast start {instance_id}"
+    )
     hass.data[DOMAIN][instance_id] = {
         "queue_manager": queue_manager,
         "config": config,
         "entry": entry,
+        "start_task": start_task,
     }
 
-    # Expose platforms
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "button"])
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    await queue_manager.async_start()
+    # Expose platforms
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so changed options take effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     instance_id = entry.entry_id
     if instance_id in hass.data[DOMAIN]:
-        queue_manager = hass.data[DOMAIN][instance_id]["queue_manager"]
+        data = hass.data[DOMAIN][instance_id]
+        data["start_task"].cancel()
+        await asyncio.gather(data["start_task"], return_exceptions=True)
+        queue_manager = data["queue_manager"]
         await queue_manager.async_stop()
         del hass.data[DOMAIN][instance_id]
 
-    await hass.config_entries.async_forward_entry_unload(entry, ["sensor", "button"])
+    await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove cached audio and the persisted queue when a config entry is deleted."""
+    await async_remove_cache(hass, entry.entry_id)
+    await QueCastQueueStore(hass, entry.entry_id, list).async_remove()
+
+
 async def _async_register_services(hass: HomeAssistant) -> None:
     """Register Que Cast services."""
 
-    async def speak_service(call: ServiceCall) -> None:
+    async def speak_service(call: ServiceCall) -> ServiceResponse:
         instance_id = call.data.get("instance_id")
         if not instance_id or instance_id not in hass.data[DOMAIN]:
             _LOGGER.error("Invalid instance_id: %s", instance_id)
-            return
+            return None
 
         queue_manager: QueCastQueueManager = hass.data[DOMAIN][instance_id]["queue_manager"]
-        await queue_manager.enqueue_speak(
-            message=call.data.get("message"),
-            language=call.data.get("language", ""),
-            options=call.data.get("options", "{}"),
-            interrupt=call.data.get("interrupt", False),
-            priority=call.data.get("priority", 0),
-            volume=call.data.get("volume_override"),
-            pre_roll=call.data.get("pre_roll_ms"),
-        )
+        item_id = await queue_manager.enqueue_speak(**_message_kwargs(call.data))
+        return {"id": item_id}
 
     hass.services.async_register(
         DOMAIN,
         "speak",
         speak_service,
+        schema=vol.Schema({vol.Required("instance_id"): str, **MESSAGE_FIELDS}),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def speak_batch_service(call: ServiceCall) -> ServiceResponse:
+        instance_id = call.data.get("instance_id")
+        if not instance_id or instance_id not in hass.data[DOMAIN]:
+            _LOGGER.error("Invalid instance_id: %s", instance_id)
+            return None
+
+        queue_manager: QueCastQueueManager = hass.data[DOMAIN][instance_id]["queue_manager"]
+        item_ids = await queue_manager.enqueue_batch(
+            [_message_kwargs(message) for message in call.data["messages"]],
+            contiguous=call.data["contiguous"],
+        )
+        return {"ids": item_ids}
+
+    hass.services.async_register(
+        DOMAIN,
+        "speak_batch",
+        speak_batch_service,
         schema=vol.Schema(
             {
                 vol.Required("instance_id"): str,
+                vol.Required("messages"): vol.All(
+                    cv.ensure_list, vol.Length(min=1), [vol.Schema(MESSAGE_FIELDS)]
+                ),
+                vol.Optional("contiguous", default=False): bool,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def broadcast_service(call: ServiceCall) -> ServiceResponse:
+        instance_ids = list(call.data.get("instance_ids", []))
+        if area_id := call.data.get("area_id"):
+            instance_ids += [i for i in instances_in_area(hass, area_id) if i not in instance_ids]
+        managers: dict[str, QueCastQueueManager] = {}
+        for instance_id in instance_ids:
+            if instance_id not in hass.data[DOMAIN]:
+                _LOGGER.error("Invalid instance_id: %s", instance_id)
+                continue
+            managers[instance_id] = hass.data[DOMAIN][instance_id]["queue_manager"]
+        if not managers:
+            _LOGGER.error("No Que Cast instances to broadcast to")
+            return None
+
+        message = call.data["message"]
+        language = call.data.get("language", "")
+        options = call.data.get("options", "{}")
+
+        broadcast = QueCastBroadcast(len(managers), call.data["sync_tolerance_ms"] / 1000.0)
+        # Synthesize once with the first room's engine; every room plays the same audio
+        try:
+            media_url, duration = await next(iter(managers.values())).async_synthesize(
+                message, broadcast, language, options
+            )
+        except Exception:
+            broadcast.release()
+            raise
+
+        results = await asyncio.gather(
+            *(
+                queue_manager.enqueue_speak(
+                    message=message,
+                    language=language,
+                    options=options,
+                    interrupt=call.data.get("interrupt", False),
+                    priority=call.data.get("priority", 0),
+                    volume=call.data.get("volume_override"),
+                    media_url=media_url,
+                    duration=duration,
+                    broadcast=broadcast,
+                    ttl=call.data.get("ttl_s"),
+                )
+                for queue_manager in managers.values()
+            ),
+            return_exceptions=True,
+        )
+        broadcast.release()
+        rooms = {}
+        for instance_id, result in zip(managers, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Broadcast to %s failed: %s", instance_id, result)
+                rooms[instance_id] = {"error": str(result)}
+            else:
+                rooms[instance_id] = {"id": result}
+        return {"rooms": rooms}
+
+    hass.services.async_register(
+        DOMAIN,
+        "broadcast",
+        broadcast_service,
+        schema=vol.Schema(
+            {
+                vol.Optional("instance_ids", default=[]): vol.All(cv.ensure_list, [str]),
+                vol.Optional("area_id"): str,
                 vol.Required("message"): str,
                 vol.Optional("language"): str,
-                vol.Optional("options"): str,
+                vol.Optional("options"): _json_options,
                 vol.Optional("interrupt", default=False): bool,
                 vol.Optional("priority", default=0): int,
                 vol.Optional("volume_override"): vol.All(vol.Coerce(float), vol.Range(0.0, 1.0)),
-                vol.Optional("pre_roll_ms"): int,
+                vol.Optional("sync_tolerance_ms", default=2000): vol.All(vol.Coerce(int), vol.Range(0, 60000)),
+                vol.Optional("ttl_s"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def get_trace_service(call: ServiceCall) -> ServiceResponse:
+        instance_id = call.data["instance_id"]
+        if instance_id not in hass.data[DOMAIN]:
+            # A response is required, so fail the call instead of logging
+            raise HomeAssistantError(f"Invalid instance_id: {instance_id}")
+
+        queue_manager: QueCastQueueManager = hass.data[DOMAIN][instance_id]["queue_manager"]
+        return {"events": queue_manager.trace.as_list(call.data.get("limit"))}
+
+    hass.services.async_register(
+        DOMAIN,
+        "get_trace",
+        get_trace_service,
+        schema=vol.Schema(
+            {
+                vol.Required("instance_id"): str,
+                vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(1, TRACE_SIZE)),
             }
         ),
+        supports_response=SupportsResponse.ONLY,
     )
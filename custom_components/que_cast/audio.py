@@ -0,0 +1,224 @@
+"""Audio helpers for Que Cast."""
+from __future__ import annotations
+
+import struct
+from typing import Optional
+
+# Layer III bitrates in kbit/s by bitrate index
+_MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = (44100, 48000, 32000)
+
+# Rough speaking rates (characters per second) for when the real duration is
+# unknown, by TTS engine and language prefix
+CHARS_PER_SECOND: dict[str, dict[str, float]] = {
+    "default": {"default": 14.0, "zh": 5.0, "ja": 7.0, "ko": 7.0},
+    "tts.google_translate_say": {"default": 13.0, "zh": 4.5, "ja": 6.5, "ko": 6.5},
+}
+
+
+def audio_duration(data: bytes, extension: str) -> Optional[float]:
+    """Return the playback duration in seconds of MP3, WAV or OGG audio."""
+    extension = extension.lower()
+    try:
+        if extension == "mp3":
+            return _mp3_duration(data)
+        if extension == "wav":
+            return _wav_duration(data)
+        if extension in ("ogg", "oga", "opus"):
+            return _ogg_duration(data)
+    except (IndexError, struct.error, ZeroDivisionError):
+        return None
+    return None
+
+
+def estimate_duration(message: str, engine: str, language: Optional[str]) -> float:
+    rates = CHARS_PER_SECOND.get(engine, CHARS_PER_SECOND["default"])
+    prefix = (language or "").split("-", 1)[0].lower()
+    return max(1.0, len(message) / rates.get(prefix, rates["default"]))
+
+
+def join_audio(
+    first: tuple[str, bytes], second: tuple[str, bytes]
+) -> Optional[tuple[str, bytes]]:
+    """Concatenate two clips into one file of the same format.
+
+    Supports MP3 at the same MPEG version and sample rate, and WAV with the
+    same sample format. Returns None for anything else.
+    """
+    extension = first[0].lower()
+    if second[0].lower() != extension:
+        return None
+    try:
+        if extension == "mp3":
+            joined = _join_mp3(first[1], second[1])
+        elif extension == "wav":
+            joined = _join_wav(first[1], second[1])
+        else:
+            return None
+    except (IndexError, struct.error, ZeroDivisionError):
+        return None
+    return (extension, joined) if joined is not None else None
+
+
+def _mp3_first_frame(data: bytes) -> Optional[int]:
+    """Return the offset of the first frame header, past any ID3v2 tag."""
+    offset = 0
+    if data[:3] == b"ID3":
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        offset = 10 + size + (10 if data[5] & 0x10 else 0)
+
+    # Find the first frame sync
+    end = len(data) - 4
+    while offset < end and not (data[offset] == 0xFF and data[offset + 1] & 0xE0 == 0xE0):
+        offset += 1
+    return offset if offset < end else None
+
+
+def _mp3_frames(data: bytes) -> Optional[tuple[int, bytes]]:
+    """Return the (version and sample rate bits, frames) of MP3 audio.
+
+    Tags are dropped, and so is a leading Xing/Info frame, whose frame count
+    would be wrong for the joined file.
+    """
+    offset = _mp3_first_frame(data)
+    if offset is None:
+        return None
+    b1, b2, b3 = data[offset + 1], data[offset + 2], data[offset + 3]
+    version = (b1 >> 3) & 0x3
+    bitrate_idx = b2 >> 4
+    rate_idx = (b2 >> 2) & 0x3
+    if version == 1 or (b1 >> 1) & 0x3 != 1 or rate_idx == 3 or bitrate_idx in (0, 15):
+        return None
+    mpeg1 = version == 3
+    end = len(data) - (128 if data[-128:-125] == b"TAG" else 0)
+
+    side_info = (17 if (b3 >> 6) == 3 else 32) if mpeg1 else (9 if (b3 >> 6) == 3 else 17)
+    if data[offset + 4 + side_info:offset + 8 + side_info] in (b"Xing", b"Info"):
+        sample_rate = _MP3_SAMPLE_RATES[rate_idx] >> (0 if mpeg1 else 1 if version == 2 else 2)
+        bitrate = _MP3_BITRATES[1 if mpeg1 else 2][bitrate_idx] * 1000
+        offset += (144 if mpeg1 else 72) * bitrate // sample_rate + ((b2 >> 1) & 0x1)
+    return (b1 & 0x18) | (b2 & 0x0C), data[offset:end]
+
+
+def _join_mp3(first: bytes, second: bytes) -> Optional[bytes]:
+    a = _mp3_frames(first)
+    b = _mp3_frames(second)
+    if a is None or b is None or a[0] != b[0]:
+        return None
+    return a[1] + b[1]
+
+
+def _wav_chunks(data: bytes) -> Optional[tuple[bytes, bytes]]:
+    """Return the fmt chunk body and the sample data of a WAV file."""
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    offset = 12
+    fmt = None
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        size = struct.unpack("<I", data[offset + 4:offset + 8])[0]
+        if chunk_id == b"fmt ":
+            fmt = data[offset + 8:offset + 8 + size]
+        elif chunk_id == b"data" and fmt is not None:
+            return fmt, data[offset + 8:offset + 8 + size]
+        offset += 8 + size + (size & 1)
+    return None
+
+
+def _join_wav(first: bytes, second: bytes) -> Optional[bytes]:
+    a = _wav_chunks(first)
+    b = _wav_chunks(second)
+    # Format tag, channels, sample rate, byte rate, block align, bits per sample
+    if a is None or b is None or a[0][:16] != b[0][:16]:
+        return None
+    fmt, samples = a[0], a[1] + b[1]
+    body = (
+        b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt + (b"\0" if len(fmt) & 1 else b"")
+        + b"data" + struct.pack("<I", len(samples)) + samples + (b"\0" if len(samples) & 1 else b"")
+    )
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def _mp3_duration(data: bytes) -> Optional[float]:
+    offset = _mp3_first_frame(data)
+    if offset is None:
+        return None
+
+    b1, b2, b3 = data[offset + 1], data[offset + 2], data[offset + 3]
+    version = (b1 >> 3) & 0x3  # 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+    layer = (b1 >> 1) & 0x3  # 1 = Layer III
+    bitrate_idx = b2 >> 4
+    rate_idx = (b2 >> 2) & 0x3
+    if version == 1 or layer != 1 or rate_idx == 3 or bitrate_idx in (0, 15):
+        return None
+
+    mpeg1 = version == 3
+    sample_rate = _MP3_SAMPLE_RATES[rate_idx] >> (0 if mpeg1 else 1 if version == 2 else 2)
+    samples_per_frame = 1152 if mpeg1 else 576
+    mono = (b3 >> 6) == 3
+
+    # VBR files carry the frame count in a Xing/Info or VBRI header
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    xing = offset + 4 + side_info
+    if data[xing:xing + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", data[xing + 4:xing + 8])[0]
+        if flags & 0x1:
+            frames = struct.unpack(">I", data[xing + 8:xing + 12])[0]
+            return frames * samples_per_frame / sample_rate
+    vbri = offset + 36
+    if data[vbri:vbri + 4] == b"VBRI":
+        frames = struct.unpack(">I", data[vbri + 14:vbri + 18])[0]
+        return frames * samples_per_frame / sample_rate
+
+    # Constant bitrate: size over bitrate, ignoring a trailing ID3v1 tag
+    audio_bytes = len(data) - offset - (128 if data[-128:-125] == b"TAG" else 0)
+    bitrate = _MP3_BITRATES[1 if mpeg1 else 2][bitrate_idx] * 1000
+    return audio_bytes * 8 / bitrate
+
+
+def _wav_duration(data: bytes) -> Optional[float]:
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    offset = 12
+    byte_rate = None
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        size = struct.unpack("<I", data[offset + 4:offset + 8])[0]
+        if chunk_id == b"fmt ":
+            byte_rate = struct.unpack("<I", data[offset + 16:offset + 20])[0]
+        elif chunk_id == b"data" and byte_rate:
+            # Streamed WAVs leave the size unset; fall back to what is there
+            size = min(size, len(data) - offset - 8)
+            return size / byte_rate
+        offset += 8 + size + (size & 1)
+    return None
+
+
+def _ogg_duration(data: bytes) -> Optional[float]:
+    if data[:4] != b"OggS":
+        return None
+    # The first packet (after the 27-byte header and segment table) identifies the codec
+    packet = 27 + data[26]
+    if data[packet:packet + 7] == b"\x01vorbis":
+        sample_rate = struct.unpack("<I", data[packet + 12:packet + 16])[0]
+        pre_skip = 0
+    elif data[packet:packet + 8] == b"OpusHead":
+        pre_skip = struct.unpack("<H", data[packet + 10:packet + 12])[0]
+        sample_rate = 48000
+    else:
+        return None
+
+    # The granule position of the last page is the total sample count
+    page = data.rfind(b"OggS")
+    while page > 0:
+        granule = struct.unpack("<q", data[page + 6:page + 14])[0]
+        if granule >= 0:
+            return max(0, granule - pre_skip) / sample_rate
+        page = data.rfind(b"OggS", 0, page)
+    return None
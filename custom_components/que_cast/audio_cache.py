@@ -0,0 +1,233 @@
+"""Synthesized-audio cache for Que Cast."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+INDEX_SAVE_DELAY = 10
+
+FILENAME_RE = re.compile(r"^[0-9a-f]{64}\.[0-9a-z]+$")
+
+
+def cache_key(
+    engine: str, language: Optional[str], options: dict, message: str, pre_roll: str = ""
+) -> str:
+    """Content address of a synthesized message, optionally after a pre-roll sound."""
+    parts = [engine, language or "", options, message]
+    if pre_roll:
+        parts.append(pre_roll)
+    raw = json.dumps(parts, sort_keys=True)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+async def async_remove_cache(hass: HomeAssistant, instance_id: str) -> None:
+    """Delete the cached audio and index of a removed instance."""
+    path = hass.config.path(DOMAIN, instance_id)
+    await hass.async_add_executor_job(shutil.rmtree, path, True)
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{instance_id}.audio_cache").async_remove()
+
+
+class QueCastCacheEntry:
+    __slots__ = ("key", "extension", "size", "created", "duration")
+
+    def __init__(
+        self,
+        key: str,
+        extension: str,
+        size: int,
+        created: float,
+        duration: Optional[float] = None,
+    ):
+        self.key = key
+        self.extension = extension
+        self.size = size
+        self.created = created
+        self.duration = duration
+
+    @property
+    def filename(self) -> str:
+        return f"{self.key}.{self.extension}"
+
+
+class QueCastAudioCache:
+    """LRU cache of synthesized audio files, bounded by entry count and bytes.
+
+    Audio lives in one file per entry; the LRU order and creation times are
+    kept in a Store-backed index so the cache survives restarts. Pinned
+    entries are still referenced by a URL waiting to be played and are not
+    evicted or expired until the last pin is released.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        instance_id: str,
+        max_entries: int,
+        max_bytes: int,
+        ttl: float = 0,
+    ):
+        self._hass = hass
+        self._dir = hass.config.path(DOMAIN, instance_id)
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{instance_id}.audio_cache")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+
+        self._entries: OrderedDict[str, QueCastCacheEntry] = OrderedDict()
+        self._bytes = 0
+        # key -> number of outstanding pins
+        self._pins: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        for key, extension, size, created, *rest in data.get("entries", []):
+            entry = QueCastCacheEntry(key, extension, size, created, *rest[:1])
+            self._entries[key] = entry
+            self._bytes += size
+
+        known = {entry.filename for entry in self._entries.values()}
+        missing = await self._hass.async_add_executor_job(self._sync_dir, known)
+        for filename in missing:
+            self._drop(filename.split(".", 1)[0])
+        self._evict()
+
+    def _sync_dir(self, known: set[str]) -> set[str]:
+        """Create the cache dir, delete orphan files and return missing ones."""
+        os.makedirs(self._dir, exist_ok=True)
+        present = set(os.listdir(self._dir))
+        for filename in present - known:
+            if FILENAME_RE.match(filename) or filename.endswith(".tmp"):
+                os.remove(os.path.join(self._dir, filename))
+        return known - present
+
+    def path(self, filename: str) -> Optional[str]:
+        """Return the file path for a cached filename, None if not cached."""
+        if not FILENAME_RE.match(filename):
+            return None
+        entry = self._entries.get(filename.split(".", 1)[0])
+        if entry is None or entry.filename != filename:
+            return None
+        return os.path.join(self._dir, filename)
+
+    def get(self, key: str) -> Optional[QueCastCacheEntry]:
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and self._ttl
+            and key not in self._pins
+            and time.time() - entry.created > self._ttl
+        ):
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        self._schedule_save()
+        return entry
+
+    async def async_put(
+        self, key: str, extension: str, data: bytes, duration: Optional[float] = None
+    ) -> QueCastCacheEntry:
+        entry = QueCastCacheEntry(key, extension, len(data), time.time(), duration)
+        await self._hass.async_add_executor_job(self._write, entry.filename, data)
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        # The caller is about to hand out this entry's URL
+        self._evict(keep=key)
+        self._schedule_save()
+        return entry
+
+    def pin(self, key: str) -> None:
+        """Keep an entry from being evicted until it is unpinned."""
+        self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, key: str) -> None:
+        count = self._pins.pop(key, 0) - 1
+        if count > 0:
+            self._pins[key] = count
+        else:
+            # Eviction skipped while pinned may be due now
+            self._evict()
+
+    def _write(self, filename: str, data: bytes) -> None:
+        os.makedirs(self._dir, exist_ok=True)
+        tmp = os.path.join(self._dir, f".{filename}.tmp")
+        with open(tmp, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp, os.path.join(self._dir, filename))
+
+    def _delete(self, filenames: list[str]) -> None:
+        for filename in filenames:
+            try:
+                os.remove(os.path.join(self._dir, filename))
+            except FileNotFoundError:
+                pass
+
+    def _drop(self, key: str) -> Optional[QueCastCacheEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+
+    def _remove(self, key: str) -> None:
+        entry = self._drop(key)
+        if entry is not None:
+            self._hass.async_add_executor_job(self._delete, [entry.filename])
+            self._schedule_save()
+
+    def _over_limits(self) -> bool:
+        return len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        if not self._over_limits():
+            return
+        evicted = []
+        for key in list(self._entries):
+            if key in self._pins or key == keep:
+                continue
+            evicted.append(self._drop(key).filename)
+            if not self._over_limits():
+                break
+        if evicted:
+            _LOGGER.debug("Evicting %d cached announcements", len(evicted))
+            self._hass.async_add_executor_job(self._delete, evicted)
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, INDEX_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        return {
+            "entries": [
+                [entry.key, entry.extension, entry.size, entry.created, entry.duration]
+                for entry in self._entries.values()
+            ]
+        }
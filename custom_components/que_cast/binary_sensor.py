@@ -0,0 +1,27 @@
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+
+from .const import DOMAIN
+from .entity import QueCastEntity
+
+
+class QueCastPlayingBinarySensor(QueCastEntity, BinarySensorEntity):
+    """On while an announcement is being played."""
+
+    _attr_icon = "mdi:bullhorn"
+
+    def __init__(self, hass: HomeAssistant, instance_id: str, config: dict):
+        super().__init__(hass, instance_id, config)
+        self._attr_name = f"Que Cast {config['name']} Playing"
+        self._attr_unique_id = f"{instance_id}_playing"
+
+    @property
+    def is_on(self) -> bool:
+        return self._queue_manager.is_playing
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
+    instance_id = entry.entry_id
+    config = hass.data[DOMAIN][instance_id]["config"]
+    async_add_entities([QueCastPlayingBinarySensor(hass, instance_id, config)])
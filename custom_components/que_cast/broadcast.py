@@ -0,0 +1,93 @@
+"""Multi-room broadcast support for Que Cast."""
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import DOMAIN
+
+
+class QueCastBroadcast:
+    """Start barrier shared by the per-room items of one broadcast.
+
+    Rooms that become ready within ``tolerance`` seconds of the first one
+    start together; a room still busy after that starts on its own. The
+    shared audio is held for as long as any room's item is pending or
+    playing; the broadcast call holds it too until every room has queued.
+    """
+
+    def __init__(self, rooms: int, tolerance: float) -> None:
+        self._waiting = rooms
+        self._tolerance = tolerance
+        self._released = asyncio.Event()
+        self._deadline: float | None = None
+        self._holds = 1
+        self._on_release: list[Callable[[], None]] = []
+
+    def on_release(self, callback: Callable[[], None]) -> None:
+        """Call callback once nothing holds the shared audio any more."""
+        self._on_release.append(callback)
+
+    def hold(self) -> None:
+        self._holds += 1
+
+    def release(self) -> None:
+        self._holds -= 1
+        if self._holds == 0:
+            callbacks, self._on_release = self._on_release, []
+            for callback in callbacks:
+                callback()
+
+    async def async_wait_ready(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._deadline is None:
+            self._deadline = loop.time() + self._tolerance
+        self._waiting -= 1
+        if self._waiting <= 0:
+            self._released.set()
+            return
+        timeout = self._deadline - loop.time()
+        if timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._released.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+def _entity_area(
+    entities: er.EntityRegistry, devices: dr.DeviceRegistry, entry: er.RegistryEntry
+) -> str | None:
+    """Return the area of an entity, falling back to its device's area."""
+    if entry.area_id is None and entry.device_id:
+        device = devices.async_get(entry.device_id)
+        return device.area_id if device else None
+    return entry.area_id
+
+
+def instances_in_area(hass: HomeAssistant, area_id: str) -> list[str]:
+    """Return the instances whose media player is in an area."""
+    entities = er.async_get(hass)
+    devices = dr.async_get(hass)
+    instance_ids = []
+    for instance_id, data in hass.data[DOMAIN].items():
+        entry = entities.async_get(data["config"]["media_player"])
+        if entry is None:
+            continue
+        if _entity_area(entities, devices, entry) == area_id:
+            instance_ids.append(instance_id)
+    return instance_ids
+
+
+def media_players_in_areas(hass: HomeAssistant, area_ids: list[str]) -> set[str]:
+    """Return the media players in any of the given areas."""
+    entities = er.async_get(hass)
+    devices = dr.async_get(hass)
+    return {
+        entry.entity_id
+        for entry in entities.entities.values()
+        if entry.domain == "media_player" and _entity_area(entities, devices, entry) in area_ids
+    }
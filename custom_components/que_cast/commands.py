@@ -0,0 +1,102 @@
+"""Media player command layer for Que Cast."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bound on concurrent media_player service calls while (un)ducking
+MAX_PARALLEL_CALLS = 8
+
+
+class QueCastPlayerCommands:
+    """Issues media_player service calls, skipping volume changes that change nothing.
+
+    The last commanded volume of each entity is remembered with the time it
+    was applied. It is trusted until the player reports a newer state, from
+    then on the reported ``volume_level`` wins, so a volume someone else
+    changed is still corrected.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+        # entity id -> (volume level, when it was commanded)
+        self._volumes: dict[str, tuple[float, datetime]] = {}
+        self.skipped = 0
+
+    def volume(self, entity_id: str) -> Optional[float]:
+        """Return the best known volume level of an entity."""
+        state = self._hass.states.get(entity_id)
+        reported = state.attributes.get("volume_level") if state is not None else None
+        commanded = self._volumes.get(entity_id)
+        if commanded is not None and (reported is None or commanded[1] >= state.last_updated):
+            return commanded[0]
+        return float(reported) if reported is not None else None
+
+    async def async_call(self, domain: str, service: str, data: dict[str, Any]) -> None:
+        await self._hass.services.async_call(domain, service, data, blocking=True)
+
+    async def async_play_media(self, entity_id: str, media_content_id: str) -> None:
+        await self.async_call(
+            "media_player", "play_media",
+            {
+                "entity_id": entity_id,
+                "media_content_id": media_content_id,
+                "media_content_type": "music",
+            },
+        )
+
+    async def async_stop(self, entity_id: str) -> None:
+        await self.async_call("media_player", "media_stop", {"entity_id": entity_id})
+
+    async def async_set_volume(self, entity_id: str, level: float) -> None:
+        await self.async_set_volumes({entity_id: level})
+
+    async def async_set_volumes(self, volumes: dict[str, float]) -> None:
+        """Apply volume levels concurrently, one call per distinct level.
+
+        Entities already at their level are skipped. Failures are logged per
+        call and never abort the remaining calls.
+        """
+        groups: dict[float, list[str]] = {}
+        for entity_id, level in volumes.items():
+            known = self.volume(entity_id)
+            # Compare loosely, since players round what they report, but send the exact
+            # level so a restored volume does not drift
+            if known is not None and round(known, 2) == round(level, 2):
+                self.skipped += 1
+                continue
+            groups.setdefault(level, []).append(entity_id)
+        if not groups:
+            return
+
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_CALLS)
+
+        async def _call(level: float, entity_ids: list[str]) -> None:
+            async with semaphore:
+                await self.async_call(
+                    "media_player", "volume_set",
+                    {"entity_id": entity_ids, "volume_level": level},
+                )
+
+        calls = list(groups.items())
+        results = await asyncio.gather(
+            *(_call(level, entity_ids) for level, entity_ids in calls),
+            return_exceptions=True,
+        )
+        now = dt_util.utcnow()
+        for (level, entity_ids), result in zip(calls, results):
+            for entity_id in entity_ids:
+                if isinstance(result, Exception):
+                    # Unknown outcome; let the next call go through
+                    self._volumes.pop(entity_id, None)
+                else:
+                    self._volumes[entity_id] = (level, now)
+            if isinstance(result, Exception):
+                _LOGGER.warning("Setting volume %s on %s failed: %s", level, entity_ids, result)
@@ -6,7 +6,7 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
-from .const import DOMAIN
+from .const import DOMAIN, OVERFLOW_POLICIES
 
 DATA_SCHEMA = vol.Schema(
     {
@@ -27,7 +27,29 @@ DATA_SCHEMA = vol.Schema(
         vol.Optional("pre_roll_ms", default=100): int,
         vol.Optional("post_grace_ms", default=200): int,
         vol.Optional("ducking_enabled", default=True): bool,
+        vol.Optional("duck_include", default=[]): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain=["media_player"], multiple=True)
+        ),
+        vol.Optional("duck_exclude", default=[]): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain=["media_player"], multiple=True)
+        ),
+        vol.Optional("duck_areas", default=[]): selector.AreaSelector(
+            selector.AreaSelectorConfig(multiple=True)
+        ),
         vol.Optional("detection_mode", default="timer"): vol.In(["timer", "state"]),
+        vol.Optional("lookahead", default=1): vol.All(vol.Coerce(int), vol.Range(0, 10)),
+        vol.Optional("cache_max_entries", default=100): vol.All(vol.Coerce(int), vol.Range(0, 10000)),
+        vol.Optional("cache_max_mb", default=50): vol.All(vol.Coerce(float), vol.Range(0, 10000)),
+        vol.Optional("cache_ttl_hours", default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("coalesce_window_s", default=0): vol.All(vol.Coerce(float), vol.Range(0, 3600)),
+        vol.Optional("batch_max_items", default=1): vol.All(vol.Coerce(int), vol.Range(1, 20)),
+        vol.Optional("batch_max_chars", default=500): vol.All(vol.Coerce(int), vol.Range(1, 5000)),
+        vol.Optional("chunk_chars", default=0): vol.All(vol.Coerce(int), vol.Range(0, 5000)),
+        vol.Optional("persist_queue", default=True): bool,
+        vol.Optional("restore_max_age_s", default=600): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("max_queue_size", default=100): vol.All(vol.Coerce(int), vol.Range(0, 10000)),
+        vol.Optional("overflow_policy", default="drop_lowest"): vol.In(OVERFLOW_POLICIES),
+        vol.Optional("message_ttl_s", default=0): vol.All(vol.Coerce(float), vol.Range(0, 86400)),
     }
 )
 
@@ -42,9 +64,6 @@ class QueCastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return QueCastOptionsFlowHandler(config_entry)
 
     async def async_step_user(self, user_input: dict | None = None) -> FlowResult:
-        if self._async_current_entries():
-            return self.async_abort(reason="single_instance_only")
-
         if user_input is not None:
             await self.async_set_unique_id(user_input["name"])
             self._abort_if_unique_id_configured()
@@ -91,7 +110,29 @@ class QueCastOptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Optional("pre_roll_ms", default=_d("pre_roll_ms", 100)): int,
                     vol.Optional("post_grace_ms", default=_d("post_grace_ms", 200)): int,
                     vol.Optional("ducking_enabled", default=_d("ducking_enabled", True)): bool,
+                    vol.Optional("duck_include", default=_d("duck_include", [])): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain=["media_player"], multiple=True)
+                    ),
+                    vol.Optional("duck_exclude", default=_d("duck_exclude", [])): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain=["media_player"], multiple=True)
+                    ),
+                    vol.Optional("duck_areas", default=_d("duck_areas", [])): selector.AreaSelector(
+                        selector.AreaSelectorConfig(multiple=True)
+                    ),
                     vol.Optional("detection_mode", default=_d("detection_mode", "timer")): vol.In(["timer", "state"]),
+                    vol.Optional("lookahead", default=_d("lookahead", 1)): vol.All(vol.Coerce(int), vol.Range(0, 10)),
+                    vol.Optional("cache_max_entries", default=_d("cache_max_entries", 100)): vol.All(vol.Coerce(int), vol.Range(0, 10000)),
+                    vol.Optional("cache_max_mb", default=_d("cache_max_mb", 50)): vol.All(vol.Coerce(float), vol.Range(0, 10000)),
+                    vol.Optional("cache_ttl_hours", default=_d("cache_ttl_hours", 0)): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional("coalesce_window_s", default=_d("coalesce_window_s", 0)): vol.All(vol.Coerce(float), vol.Range(0, 3600)),
+                    vol.Optional("batch_max_items", default=_d("batch_max_items", 1)): vol.All(vol.Coerce(int), vol.Range(1, 20)),
+                    vol.Optional("batch_max_chars", default=_d("batch_max_chars", 500)): vol.All(vol.Coerce(int), vol.Range(1, 5000)),
+                    vol.Optional("chunk_chars", default=_d("chunk_chars", 0)): vol.All(vol.Coerce(int), vol.Range(0, 5000)),
+                    vol.Optional("persist_queue", default=_d("persist_queue", True)): bool,
+                    vol.Optional("restore_max_age_s", default=_d("restore_max_age_s", 600)): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional("max_queue_size", default=_d("max_queue_size", 100)): vol.All(vol.Coerce(int), vol.Range(0, 10000)),
+                    vol.Optional("overflow_policy", default=_d("overflow_policy", "drop_lowest")): vol.In(OVERFLOW_POLICIES),
+                    vol.Optional("message_ttl_s", default=_d("message_ttl_s", 0)): vol.All(vol.Coerce(float), vol.Range(0, 86400)),
                 }
             ),
         )
@@ -15,4 +15,29 @@ CONF_PRE_ROLL_SOUND = "pre_roll_sound"
 CONF_PRE_ROLL_MS = "pre_roll_ms"
 CONF_POST_GRACE_MS = "post_grace_ms"
 CONF_DUCKING_ENABLED = "ducking_enabled"
+CONF_DUCK_INCLUDE = "duck_include"
+CONF_DUCK_EXCLUDE = "duck_exclude"
+CONF_DUCK_AREAS = "duck_areas"
 CONF_DETECTION_MODE = "detection_mode"
+CONF_LOOKAHEAD = "lookahead"
+CONF_CACHE_MAX_ENTRIES = "cache_max_entries"
+CONF_CACHE_MAX_MB = "cache_max_mb"
+CONF_CACHE_TTL_HOURS = "cache_ttl_hours"
+CONF_COALESCE_WINDOW_S = "coalesce_window_s"
+CONF_BATCH_MAX_ITEMS = "batch_max_items"
+CONF_BATCH_MAX_CHARS = "batch_max_chars"
+CONF_CHUNK_CHARS = "chunk_chars"
+CONF_PERSIST_QUEUE = "persist_queue"
+CONF_RESTORE_MAX_AGE_S = "restore_max_age_s"
+CONF_MAX_QUEUE_SIZE = "max_queue_size"
+CONF_OVERFLOW_POLICY = "overflow_policy"
+CONF_MESSAGE_TTL_S = "message_ttl_s"
+
+OVERFLOW_POLICIES = ["drop_lowest", "drop_oldest", "reject_newest"]
+
+# hass.data key of the scheduler shared by all instances
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+# Dispatcher signals, formatted with the instance id
+SIGNAL_QUEUE_UPDATED = f"{DOMAIN}_queue_updated_{{}}"
+SIGNAL_STATS_UPDATED = f"{DOMAIN}_stats_updated_{{}}"
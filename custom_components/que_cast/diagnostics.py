@@ -0,0 +1,35 @@
+"""Diagnostics support for Que Cast."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .queue_manager import QueCastQueueManager
+from .stats import STAGES
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the configuration, queue state, statistics and trace of an instance."""
+    diagnostics: dict[str, Any] = {"config": dict(entry.data), "options": dict(entry.options)}
+    data = hass.data[DOMAIN].get(entry.entry_id)
+    if data is None:
+        return diagnostics
+
+    queue_manager: QueCastQueueManager = data["queue_manager"]
+    current = queue_manager.current_item
+    diagnostics.update(
+        {
+            "queue_size": queue_manager.queue_size,
+            "playing": queue_manager.is_playing,
+            "current_item": current.id if current is not None else None,
+            "counters": dict(queue_manager.stats.counters),
+            "latency_ms": {stage: queue_manager.stats.percentiles(stage) for stage in STAGES},
+            "trace": queue_manager.trace.as_list(),
+        }
+    )
+    return diagnostics
@@ -0,0 +1,144 @@
+"""Pending item queue for Que Cast."""
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections import deque
+from typing import Any, Iterator, Optional
+
+
+class QueCastPendingQueue:
+    """Priority queue of pending items, FIFO within the same priority.
+
+    Interrupting items form a lane ahead of all others, so they play next
+    whatever their priority. Heap entries are ``(lane, -priority, seq, item)``;
+    the sequence number is unique, so ties never fall through to comparing
+    items. Removal is lazy: a removed item is flagged and its entry discarded
+    when it reaches the top, which keeps the top of the heap live and ``peek``
+    O(1). A priority or lane change pushes a fresh entry with the same
+    sequence number and leaves the old one stale.
+    Items are also kept in push order, pruned the same way, so the oldest
+    pending item is O(1) too.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, int, Any]] = []
+        self._order: deque[Any] = deque()
+        self._seq = itertools.count()
+        # Sequence numbers below every pushed item, handed out by push_front
+        self._front_seq = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __bool__(self) -> bool:
+        return self._len > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate pending items in playback order (O(n log n) snapshot)."""
+        return iter([entry[3] for entry in sorted(self._heap) if _live(entry)])
+
+    def push(self, item: Any) -> None:
+        item.seq = next(self._seq)
+        item.queued = True
+        heapq.heappush(self._heap, _entry(item))
+        self._order.append(item)
+        self._len += 1
+
+    def push_front(self, items: list[Any]) -> None:
+        """Push items ahead of every pending item of the same priority.
+
+        The items keep their order among themselves; used to put restored
+        items before ones queued while the restore was running.
+        """
+        self._front_seq -= len(items)
+        for seq, item in enumerate(items, self._front_seq):
+            item.seq = seq
+            item.queued = True
+            heapq.heappush(self._heap, _entry(item))
+        self._order.extendleft(reversed(items))
+        self._len += len(items)
+
+    def peek(self) -> Optional[Any]:
+        return self._heap[0][3] if self._len else None
+
+    def oldest(self) -> Optional[Any]:
+        """Return the earliest-pushed pending item."""
+        return self._order[0] if self._len else None
+
+    def last(self) -> Optional[Any]:
+        """Return the item that would play last (O(n))."""
+        live = [entry for entry in self._heap if _live(entry)]
+        return max(live)[3] if live else None
+
+    def head(self, n: int) -> list[Any]:
+        """Return up to n items from the front of the queue in playback order."""
+        k = n
+        while True:
+            entries = heapq.nsmallest(k, self._heap)
+            live = [entry[3] for entry in entries if _live(entry)]
+            if len(live) >= n or k >= len(self._heap):
+                return live[:n]
+            k *= 2
+
+    def pop(self) -> Optional[Any]:
+        if not self._len:
+            return None
+        item = heapq.heappop(self._heap)[3]
+        item.queued = False
+        self._len -= 1
+        self._prune()
+        return item
+
+    def reprioritize(self, item: Any, priority: int, interrupt: Optional[bool] = None) -> None:
+        """Move a pending item to a new priority and/or lane, keeping its FIFO position."""
+        if interrupt is None:
+            interrupt = item.interrupt
+        moved = item.priority != priority or item.interrupt != interrupt
+        item.priority = priority
+        item.interrupt = interrupt
+        if item.queued and moved:
+            heapq.heappush(self._heap, _entry(item))
+            self._prune()
+
+    def remove(self, item: Any) -> bool:
+        if not item.queued:
+            return False
+        item.queued = False
+        self._len -= 1
+        self._prune()
+        return True
+
+    def clear(self) -> list[Any]:
+        """Remove every pending item and return them."""
+        items = list(self)
+        for item in items:
+            item.queued = False
+        self._heap.clear()
+        self._order.clear()
+        self._len = 0
+        return items
+
+    def _prune(self) -> None:
+        heap = self._heap
+        while heap and not _live(heap[0]):
+            heapq.heappop(heap)
+        # Rebuild once stale entries dominate so lazy removal stays bounded
+        if len(heap) > 2 * self._len + 32:
+            self._heap = [entry for entry in heap if _live(entry)]
+            heapq.heapify(self._heap)
+        order = self._order
+        while order and not order[0].queued:
+            order.popleft()
+        if len(order) > 2 * self._len + 32:
+            self._order = deque(item for item in order if item.queued)
+
+
+def _entry(item: Any) -> tuple[int, int, int, Any]:
+    return (0 if item.interrupt else 1, -item.priority, item.seq, item)
+
+
+def _live(entry: tuple[int, int, int, Any]) -> bool:
+    item = entry[3]
+    return item.queued and entry[0] == (0 if item.interrupt else 1) and entry[1] == -item.priority
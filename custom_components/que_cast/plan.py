@@ -0,0 +1,94 @@
+"""Playback plans for Que Cast."""
+from __future__ import annotations
+
+import json
+import re
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional
+
+from .synthesis import split_engine
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# Shorter "sentences" are taken to be abbreviations such as "Dr." or "No."
+_MIN_SENTENCE_CHARS = 12
+
+
+class QueCastPlaybackPlan(NamedTuple):
+    """Everything needed to speak one item, resolved once when it is queued."""
+
+    domain: str
+    service: str
+    language: Optional[str]
+    options: Mapping[str, Any]
+    # Complete data of the TTS service call
+    service_data: Mapping[str, Any]
+    volume: float
+    # Sentence chunks spoken one after another; empty to speak the message whole
+    chunks: tuple[str, ...] = ()
+
+
+def parse_options(text: Optional[str]) -> dict[str, Any]:
+    """Parse TTS options given as a JSON object; raise ValueError otherwise."""
+    if not text:
+        return {}
+    try:
+        options = json.loads(text)
+    except ValueError as err:
+        raise ValueError(f"options are not valid JSON: {err}") from err
+    if not isinstance(options, dict):
+        raise ValueError("options must be a JSON object")
+    return options
+
+
+def split_chunks(message: str, max_chars: int) -> tuple[str, ...]:
+    """Split message at sentence boundaries into chunks of up to max_chars.
+
+    The first chunk is a single sentence so its audio is ready quickly; a
+    sentence longer than max_chars is a chunk of its own. A terminator
+    followed by a lowercase word or ending a very short piece is taken to
+    be an abbreviation, not a sentence end. Returns an empty tuple if the
+    message does not split.
+    """
+    sentences: list[str] = []
+    for part in _SENTENCE_END.split(message.strip()):
+        if sentences and (part[:1].islower() or len(sentences[-1]) < _MIN_SENTENCE_CHARS):
+            sentences[-1] += " " + part
+        else:
+            sentences.append(part)
+    chunks: list[str] = []
+    for sentence in sentences:
+        if len(chunks) > 1 and len(chunks[-1]) + 1 + len(sentence) <= max_chars:
+            chunks[-1] += " " + sentence
+        else:
+            chunks.append(sentence)
+    return tuple(chunks) if len(chunks) > 1 else ()
+
+
+def build_plan(
+    engine: str,
+    media_player: str,
+    message: str,
+    language: Optional[str],
+    options: Mapping[str, Any],
+    volume: float,
+    chunk_chars: int = 0,
+) -> QueCastPlaybackPlan:
+    domain, service = split_engine(engine)
+
+    service_data: dict[str, Any] = {"message": message, "cache": False}
+    if language:
+        service_data["language"] = language
+    service_data.update(options)
+    # 'tts.speak' uses 'media_player_entity_id'; legacy TTS uses 'entity_id'
+    key = "media_player_entity_id" if service == "speak" else "entity_id"
+    service_data[key] = media_player
+
+    return QueCastPlaybackPlan(
+        domain=domain,
+        service=service,
+        language=language,
+        options=MappingProxyType(dict(options)),
+        service_data=MappingProxyType(service_data),
+        volume=volume,
+        chunks=split_chunks(message, chunk_chars) if 0 < chunk_chars < len(message) else (),
+    )
@@ -2,18 +2,77 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import heapq
+import itertools
 import logging
-from datetime import time
+from collections import deque
+from datetime import datetime, time
+from time import monotonic
 from typing import Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.components.media_player import async_process_play_media_url
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
+from .audio import audio_duration, estimate_duration, join_audio
+from .audio_cache import QueCastAudioCache, QueCastCacheEntry, cache_key
+from .broadcast import QueCastBroadcast, media_players_in_areas
+from .const import DOMAIN, SIGNAL_QUEUE_UPDATED, SIGNAL_STATS_UPDATED
+from .pending_queue import QueCastPendingQueue
+from .plan import QueCastPlaybackPlan, build_plan, parse_options
+from .scheduler import get_scheduler
+from .stats import QueCastStats
+from .storage import QueCastQueueStore
+from .synthesis import async_fetch_audio, async_resolve_media_url, async_synthesize
+from .trace import QueCastTrace
+from .views import AUDIO_URL
+
 _LOGGER = logging.getLogger(__name__)
 
+# Process-wide so ids never collide across instances
+_ITEM_IDS = itertools.count(1)
+
+# Allowance for the player buffering before audio actually starts
+PLAYBACK_START_SLACK = 0.5
+
+# In state detection, how long past the expected end to wait for a player
+# that never reports "playing" before treating the item as done
+STATE_START_GUARD = 3.0
+DONE_STATES = {"idle", "off", "paused"}
+
+# How long to wait for a missing media player before raising a repair issue
+PLAYER_WAIT_TIMEOUT = 300
+
 
 class QueCastQueueItem:
+    __slots__ = (
+        "message",
+        "language",
+        "options",
+        "priority",
+        "volume",
+        "pre_roll",
+        "interrupt",
+        "timestamp",
+        "id",
+        "seq",
+        "queued",
+        "started",
+        "duration",
+        "phase",
+        "media_url",
+        "broadcast",
+        "expires",
+        "group",
+        "plan",
+        "pre_rolled",
+        "failed",
+    )
+
     def __init__(
         self,
         message: str,
@@ -23,6 +82,8 @@ class QueCastQueueItem:
         volume: Optional[float] = None,
         pre_roll: Optional[int] = None,
         interrupt: bool = False,
+        media_url: Optional[str] = None,
+        broadcast: Optional[QueCastBroadcast] = None,
     ):
         self.message = message
         self.language = language or None
@@ -32,7 +93,88 @@ class QueCastQueueItem:
         self.pre_roll = pre_roll
         self.interrupt = interrupt
         self.timestamp = dt_util.utcnow()
-        self.id = hash(f"{message}{language}{self.timestamp}")
+        self.id = next(_ITEM_IDS)
+        self.seq = 0
+        self.queued = False
+        # Playback start (monotonic) and audio length in seconds, once known
+        self.started: Optional[float] = None
+        self.duration: Optional[float] = None
+        # Player-reported progress in state detection: starting/playing/ended
+        self.phase: Optional[str] = None
+        # Audio synthesized up front, e.g. once for every room of a broadcast
+        self.media_url = media_url
+        self.broadcast = broadcast
+        # Deadline as a UTC epoch timestamp; the item is dropped if still pending
+        self.expires: Optional[float] = None
+        # Members, in order, of the contiguous group this item belongs to
+        self.group: Optional[list[QueCastQueueItem]] = None
+        # Resolved TTS call, options and volume, set when the item is created
+        self.plan: Optional[QueCastPlaybackPlan] = None
+        # Whether the synthesized audio starts with the pre-roll sound
+        self.pre_rolled = False
+        # Whether playback failed; the item then counts as failed, not played
+        self.failed = False
+
+
+def _playback_key(item: QueCastQueueItem) -> tuple:
+    """Settings that must match for two items to be spoken as one."""
+    return (item.language, item.options, item.volume, item.pre_roll)
+
+
+def _coalesce_key(item: QueCastQueueItem) -> tuple:
+    return (item.message, *_playback_key(item))
+
+
+def _item_to_dict(item: QueCastQueueItem) -> dict:
+    # Shared broadcast audio and sync are not persisted; restored items
+    # are synthesized again by their own instance
+    return {
+        "id": item.id,
+        "message": item.message,
+        "language": item.language,
+        "options": item.options,
+        "priority": item.priority,
+        "volume": item.volume,
+        "pre_roll": item.pre_roll,
+        "interrupt": item.interrupt,
+        "timestamp": item.timestamp.isoformat(),
+        "expires": item.expires,
+    }
+
+
+def _item_from_dict(data: dict) -> QueCastQueueItem:
+    item = QueCastQueueItem(
+        message=data["message"],
+        language=data.get("language") or "",
+        options=data.get("options", "{}"),
+        priority=data.get("priority", 0),
+        volume=data.get("volume"),
+        pre_roll=data.get("pre_roll"),
+        interrupt=data.get("interrupt", False),
+    )
+    item.timestamp = dt_util.parse_datetime(data["timestamp"]) or item.timestamp
+    item.expires = data.get("expires")
+    return item
+
+
+def _batchable(item: QueCastQueueItem) -> bool:
+    return (
+        item.priority <= 0
+        and not item.interrupt
+        and item.media_url is None
+        and item.broadcast is None
+        and item.group is None
+    )
+
+
+def _join_messages(parts: list[str]) -> str:
+    sentences = []
+    for part in parts:
+        part = part.strip()
+        if part and part[-1] not in ".!?":
+            part += "."
+        sentences.append(part)
+    return " ".join(sentences)
 
 
 class QueCastQueueManager:
@@ -44,35 +186,233 @@ class QueCastQueueManager:
         self._media_player = config["media_player"]
         self._tts_engine = config.get("tts_engine", "tts.speak")
         self._default_language = config.get("default_language")
-        self._default_options = config.get("default_options", "{}")
+        try:
+            self._default_options = parse_options(config.get("default_options", "{}"))
+        except ValueError as err:
+            _LOGGER.error("Ignoring invalid default options: %s", err)
+            self._default_options = {}
         self._day_volume = config.get("day_volume", 0.5)
         self._night_volume = config.get("night_volume", 0.3)
         self._quiet_start = time.fromisoformat(config.get("quiet_start", "22:00"))
         self._quiet_end = time.fromisoformat(config.get("quiet_end", "07:00"))
         self._pre_roll_sound = config.get("pre_roll_sound", "")
         self._pre_roll_ms = config.get("pre_roll_ms", 100)
+        # Fetches the pre-roll sound once for joining into synthesized audio
+        self._pre_roll_task: Optional[asyncio.Task] = None
         self._post_grace_ms = config.get("post_grace_ms", 200)
         self._ducking_enabled = config.get("ducking_enabled", True)
+        self._duck_include = config.get("duck_include", [])
+        self._duck_areas = config.get("duck_areas", [])
+        self._duck_exclude = frozenset(config.get("duck_exclude", []))
+        # Players this instance may duck, resolved on start; None means any
+        self._duck_candidates: Optional[frozenset[str]] = None
         self._detection_mode = config.get("detection_mode", "timer")
+        self._lookahead = config.get("lookahead", 1)
+        self._coalesce_window = config.get("coalesce_window_s", 0)
+        self._batch_max_items = config.get("batch_max_items", 1)
+        self._batch_max_chars = config.get("batch_max_chars", 500)
+        self._chunk_chars = config.get("chunk_chars", 0)
+        self._restore_max_age = config.get("restore_max_age_s", 600)
+        self._max_queue_size = config.get("max_queue_size", 100)
+        self._overflow_policy = config.get("overflow_policy", "drop_lowest")
+        self._message_ttl = config.get("message_ttl_s", 0)
+        self._overflowing = False
+
+        cache_max_entries = config.get("cache_max_entries", 100)
+        self.audio_cache: Optional[QueCastAudioCache] = None
+        if cache_max_entries > 0:
+            self.audio_cache = QueCastAudioCache(
+                hass,
+                instance_id,
+                max_entries=cache_max_entries,
+                max_bytes=int(config.get("cache_max_mb", 50) * 1024 * 1024),
+                ttl=config.get("cache_ttl_hours", 0) * 3600,
+            )
 
-        self._queue: list[QueCastQueueItem] = []
+        self._queue = QueCastPendingQueue()
         self._current_item: Optional[QueCastQueueItem] = None
         self._is_playing = False
-        self._task: Optional[asyncio.Task] = None
-        self._original_volumes: dict[str, float] = {}
+        # Starts the current item (synthesis through the TTS call); cancelled on interrupt
+        self._play_task: Optional[asyncio.Task] = None
+        # media_stop of an interrupted item, awaited before the next item plays
+        self._stop_task: Optional[asyncio.Task] = None
+        self._unsub_player: Optional[CALLBACK_TYPE] = None
+        # Set while waiting for the media player entity to appear
+        self._unsub_wait: Optional[CALLBACK_TYPE] = None
+        self._unsub_wait_timeout: Optional[CALLBACK_TYPE] = None
+        self._issue_raised = False
+        # Steps this instance and owns ducking shared with the other instances
+        self._scheduler = get_scheduler(hass)
+        self._commands = self._scheduler.commands
         self._lock = asyncio.Lock()
+        # Set on every wake; lets the post-playback grace end early on an interrupt
+        self._wakeup = asyncio.Event()
+        self._update_scheduled = False
+        self.stats = QueCastStats()
+        self.trace = QueCastTrace()
+        # item id -> task resolving the item to a playable media URL
+        self._prepared: dict[int, asyncio.Task] = {}
+        # item id -> cache keys its audio URLs point at, pinned until it is done
+        self._pinned: dict[int, list[str]] = {}
+        # coalescing key -> pending item that identical messages merge into
+        self._pending_by_key: dict[tuple, QueCastQueueItem] = {}
+        # Remaining members of the contiguous group being played
+        self._active_group: deque[QueCastQueueItem] = deque()
+        # (expires, id, item) for items with a deadline, soonest first; entries
+        # of items no longer pending are discarded lazily like the queue's own
+        self._expiry: list[tuple[float, int, QueCastQueueItem]] = []
+
+        self._store: Optional[QueCastQueueStore] = None
+        if config.get("persist_queue", True):
+            self._store = QueCastQueueStore(hass, instance_id, self._snapshot)
+
+    async def async_load(self) -> None:
+        if self.audio_cache is not None:
+            await self.audio_cache.async_load()
+        if self._store is not None:
+            await self._async_restore_queue()
+
+    async def _async_restore_queue(self) -> None:
+        """Rebuild the queue persisted before a restart or reload."""
+        now = dt_util.utcnow()
+        items: list[QueCastQueueItem] = []
+        dropped = 0
+        for data in await self._store.async_load():
+            item = _item_from_dict(data)
+            if (now - item.timestamp).total_seconds() > self._restore_max_age or (
+                item.expires is not None and item.expires <= now.timestamp()
+            ):
+                dropped += 1
+                continue
+            try:
+                item.plan = self._plan(item)
+            except ValueError:
+                dropped += 1
+                continue
+            items.append(item)
+        async with self._lock:
+            # Messages spoken while loading were queued already; the restored
+            # ones are older, so they go first within their priority
+            self._queue.push_front(items)
+            for item in items:
+                self._track_expiry(item)
+                self.trace.record(item.id, "restored", priority=item.priority)
+            self._schedule_lookahead()
+        if items or dropped:
+            _LOGGER.info("Restored %d queued messages, dropped %d stale ones", len(items), dropped)
+            self._notify()
+        # Restored items got fresh ids, so start over from a snapshot
+        await self._store.async_compact()
+
+    def _snapshot(self) -> list[dict]:
+        items = list(self._queue)
+        if self._current_item is not None:
+            items.insert(0, self._current_item)
+        return [_item_to_dict(item) for item in items]
+
+    def _journal_put(self, item: QueCastQueueItem) -> None:
+        if self._store is not None:
+            self._store.put(_item_to_dict(item))
+
+    def _journal_delete(self, item: QueCastQueueItem) -> None:
+        if self._store is not None:
+            self._store.delete(item.id)
 
     async def async_start(self) -> None:
-        if self._task is None or self._task.done():
-            self._task = asyncio.create_task(self._queue_worker())
+        """Start playing the queue, or wait for the media player to become available.
+
+        Messages are accepted and queued either way; they play once the
+        player is there.
+        """
+        if self._duck_include or self._duck_areas:
+            candidates = set(self._duck_include)
+            if self._duck_areas:
+                candidates |= media_players_in_areas(self._hass, self._duck_areas)
+            self._duck_candidates = frozenset(candidates)
+        if self._detection_mode == "state" and self._unsub_player is None:
+            self._unsub_player = async_track_state_change_event(
+                self._hass, [self._media_player], self._async_player_state_changed
+            )
+        state = self._hass.states.get(self._media_player)
+        if state is not None and state.state != STATE_UNAVAILABLE:
+            self._scheduler.register(self)
+        elif self._unsub_wait is None:
+            _LOGGER.info("Media player %s is not available yet, queueing until it is", self._media_player)
+            self._unsub_wait = async_track_state_change_event(
+                self._hass, [self._media_player], self._async_player_appeared
+            )
+            self._unsub_wait_timeout = async_call_later(
+                self._hass, PLAYER_WAIT_TIMEOUT, self._async_player_wait_timeout
+            )
+
+    @callback
+    def _async_player_appeared(self, event: Event) -> None:
+        new_state = event.data.get("new_state")
+        if new_state is None or new_state.state == STATE_UNAVAILABLE:
+            return
+        self._stop_waiting()
+        _LOGGER.info("Media player %s is available, starting the queue", self._media_player)
+        self._scheduler.register(self)
+
+    @callback
+    def _async_player_wait_timeout(self, _now) -> None:
+        self._unsub_wait_timeout = None
+        _LOGGER.warning(
+            "Media player %s is still not available after %d seconds; %d messages are waiting",
+            self._media_player,
+            PLAYER_WAIT_TIMEOUT,
+            len(self._queue),
+        )
+        self._issue_raised = True
+        ir.async_create_issue(
+            self._hass,
+            DOMAIN,
+            self._issue_id,
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key="player_unavailable",
+            translation_placeholders={
+                "name": self._config.get("name", self._instance_id),
+                "media_player": self._media_player,
+            },
+        )
+
+    @property
+    def _issue_id(self) -> str:
+        return f"player_unavailable_{self._instance_id}"
+
+    def _stop_waiting(self) -> None:
+        if self._unsub_wait is not None:
+            self._unsub_wait()
+            self._unsub_wait = None
+        if self._unsub_wait_timeout is not None:
+            self._unsub_wait_timeout()
+            self._unsub_wait_timeout = None
+        if self._issue_raised:
+            self._issue_raised = False
+            ir.async_delete_issue(self._hass, DOMAIN, self._issue_id)
 
     async def async_stop(self) -> None:
-        if self._task and not self._task.done():
-            self._task.cancel()
+        self._stop_waiting()
+        if self._unsub_player is not None:
+            self._unsub_player()
+            self._unsub_player = None
+        for item in [*self._queue, self._current_item]:
+            if item is not None:
+                self._release(item)
+        self._cancel_prepared()
+        if self._pre_roll_task is not None and not self._pre_roll_task.done():
+            self._pre_roll_task.cancel()
+        if self._play_task and not self._play_task.done():
+            self._play_task.cancel()
             try:
-                await self._task
+                await self._play_task
             except asyncio.CancelledError:
                 pass
+        # Also releases any players this instance still holds ducked
+        await self._scheduler.async_unregister(self)
+        if self._store is not None:
+            await self._store.async_close()
 
     async def enqueue_speak(
         self,
@@ -83,7 +423,64 @@ class QueCastQueueManager:
         priority: int = 0,
         volume: Optional[float] = None,
         pre_roll: Optional[int] = None,
-    ) -> None:
+        media_url: Optional[str] = None,
+        duration: Optional[float] = None,
+        broadcast: Optional[QueCastBroadcast] = None,
+        ttl: Optional[float] = None,
+    ) -> Optional[int]:
+        """Queue a message and return the id of the item that will speak it.
+
+        Returns None if the queue is full and the overflow policy rejects it.
+        """
+        item = self._new_item(
+            message, language, options, interrupt, priority, volume, pre_roll, ttl,
+            media_url=media_url,
+            broadcast=broadcast,
+        )
+        item.duration = duration
+        async with self._lock:
+            item_id = self._enqueue(item)
+
+        self._notify()
+        self._wake()
+        return item_id
+
+    async def enqueue_batch(
+        self, messages: list[dict], contiguous: bool = False
+    ) -> list[Optional[int]]:
+        """Queue several messages under one lock acquisition.
+
+        Each message is a dict of enqueue_speak arguments. With contiguous,
+        the messages play back to back in order at the highest of their
+        priorities; only an interrupting message can come between them.
+        Returns the item ids in message order, None for rejected messages.
+        """
+        items = [self._new_item(**message) for message in messages]
+        if contiguous and len(items) > 1:
+            priority = max(item.priority for item in items)
+            for i, item in enumerate(items):
+                item.priority = priority
+                item.interrupt = items[0].interrupt if i == 0 else False
+                item.group = items
+        async with self._lock:
+            item_ids = [self._enqueue(item) for item in items]
+
+        self._notify()
+        self._wake()
+        return item_ids
+
+    def _new_item(
+        self,
+        message: str,
+        language: str = "",
+        options: str = "{}",
+        interrupt: bool = False,
+        priority: int = 0,
+        volume: Optional[float] = None,
+        pre_roll: Optional[int] = None,
+        ttl: Optional[float] = None,
+        **kwargs,
+    ) -> QueCastQueueItem:
         item = QueCastQueueItem(
             message=message,
             language=language,
@@ -92,148 +489,827 @@ class QueCastQueueManager:
             volume=volume,
             pre_roll=(pre_roll if pre_roll is not None else self._pre_roll_ms),
             interrupt=interrupt,
+            **kwargs,
         )
-        async with self._lock:
-            if interrupt and self._current_item:
-                self._current_item = None
-                await self._stop_current()
-
-            # priority queue: higher number first
-            inserted = False
-            for i, existing in enumerate(self._queue):
-                if item.priority > existing.priority:
-                    self._queue.insert(i, item)
-                    inserted = True
-                    break
-            if not inserted:
-                self._queue.append(item)
+        ttl = ttl if ttl is not None else self._message_ttl
+        if ttl:
+            item.expires = item.timestamp.timestamp() + ttl
+        item.plan = self._plan(item)
+        return item
+
+    def _plan(self, item: QueCastQueueItem) -> QueCastPlaybackPlan:
+        """Resolve how item will be spoken; raises ValueError for invalid options."""
+        return build_plan(
+            self._tts_engine,
+            self._media_player,
+            item.message,
+            item.language or self._default_language or None,
+            {**self._default_options, **parse_options(item.options)},
+            self._get_current_volume(item.volume),
+            self._chunk_chars,
+        )
+
+    def _enqueue(self, item: QueCastQueueItem) -> Optional[int]:
+        """Admit item into the queue; the caller holds the lock."""
+        self._purge_expired()
+        survivor = self._coalesce(item)
+        if survivor is None and not self._make_room(item):
+            self.trace.record(item.id, "rejected", policy=self._overflow_policy)
+            self._notify_stats()
+            return None
+
+        if item.interrupt and self._current_item:
+            self.stats.count("interrupted")
+            self.trace.record(self._current_item.id, "interrupted", by=item.id)
+            self._stop_current()
 
-        await self.async_start()
+        if survivor is None:
+            if item.broadcast is not None:
+                item.broadcast.hold()
+            self._push(item)
+            self.trace.record(
+                item.id, "enqueued", priority=item.priority, interrupt=item.interrupt, chars=len(item.message)
+            )
+            if self._coalesce_window:
+                self._pending_by_key[_coalesce_key(item)] = item
+            survivor = item
+        self._journal_put(survivor)
+        self._schedule_lookahead()
+        return survivor.id
+
+    def _push(self, item: QueCastQueueItem) -> None:
+        # priority queue: higher number first, FIFO within a priority
+        self._queue.push(item)
+        self._track_expiry(item)
+
+    def _track_expiry(self, item: QueCastQueueItem) -> None:
+        if item.expires is not None:
+            heapq.heappush(self._expiry, (item.expires, item.id, item))
+
+    def _discard(self, item: QueCastQueueItem) -> None:
+        """Remove a pending item that will not be played."""
+        self._queue.remove(item)
+        self._forget_pending(item)
+        self._cancel_prepared(item)
+        self._journal_delete(item)
+
+    def _make_room(self, item: QueCastQueueItem) -> bool:
+        """Apply the overflow policy if the queue is full; False rejects item."""
+        if not self._max_queue_size or len(self._queue) < self._max_queue_size:
+            self._overflowing = False
+            return True
+        if not self._overflowing:
+            # Once per overflow episode, so a runaway automation cannot flood the log
+            self._overflowing = True
+            _LOGGER.warning(
+                "Queue full (%d items), applying overflow policy %s",
+                len(self._queue),
+                self._overflow_policy,
+            )
+        victim = None
+        if self._overflow_policy == "drop_oldest":
+            victim = self._queue.oldest()
+        elif self._overflow_policy == "drop_lowest":
+            # The item that would play last; if the new one would play after
+            # it anyway, the new one is the lowest
+            victim = self._queue.last()
+            if victim is not None and victim.priority >= item.priority:
+                victim = None
+
+        if victim is None:
+            _LOGGER.debug("Queue full, rejecting message")
+            self.stats.count("rejected")
+            return False
+        _LOGGER.debug("Queue full, dropping item %s", victim.id)
+        self.stats.count("dropped")
+        self.trace.record(victim.id, "dropped", policy=self._overflow_policy)
+        self._discard(victim)
+        return True
+
+    def _purge_expired(self) -> None:
+        """Drop pending items past their deadline, touching only expired entries."""
+        expiry = self._expiry
+        if not expiry:
+            return
+        now = dt_util.utcnow().timestamp()
+        expired = 0
+        while expiry and (expiry[0][0] <= now or not expiry[0][2].queued):
+            item = heapq.heappop(expiry)[2]
+            if item.queued:
+                self._discard(item)
+                self.trace.record(item.id, "expired")
+                expired += 1
+        # Rebuild once entries of played or dropped items dominate
+        if len(expiry) > 2 * len(self._queue) + 32:
+            self._expiry = [entry for entry in expiry if entry[2].queued]
+            heapq.heapify(self._expiry)
+        if expired:
+            _LOGGER.debug("Dropped %d expired messages", expired)
+            self.stats.count("expired", expired)
+            self._notify()
+            self._notify_stats()
+
+    def _coalesce(self, item: QueCastQueueItem) -> Optional[QueCastQueueItem]:
+        """Merge item into an identical pending one enqueued within the window."""
+        if not self._coalesce_window or item.broadcast is not None or item.group is not None:
+            return None
+        existing = self._pending_by_key.get(_coalesce_key(item))
+        if existing is None or not existing.queued:
+            return None
+        if (item.timestamp - existing.timestamp).total_seconds() > self._coalesce_window:
+            return None
+
+        self._queue.reprioritize(
+            existing, max(existing.priority, item.priority), existing.interrupt or item.interrupt
+        )
+        _LOGGER.debug("Coalesced duplicate message into pending item %s", existing.id)
+        self.trace.record(existing.id, "coalesced", priority=existing.priority)
+        return existing
+
+    def _forget_pending(self, item: QueCastQueueItem) -> None:
+        key = _coalesce_key(item)
+        if self._pending_by_key.get(key) is item:
+            del self._pending_by_key[key]
 
     async def clear_queue(self) -> None:
         async with self._lock:
-            self._queue.clear()
+            cleared = self._queue.clear()
+            for item in cleared:
+                self._cancel_prepared(item)
+            self.trace.record(None, "cleared", items=len(cleared))
+            self._pending_by_key.clear()
+            self._expiry.clear()
+            self._active_group.clear()
+            if self._store is not None:
+                self._store.clear()
+                if self._current_item is not None:
+                    self._journal_put(self._current_item)
+        self._notify()
+        self._wake()
 
     async def skip_current(self) -> None:
         async with self._lock:
             if self._current_item:
-                self._current_item = None
-                await self._stop_current()
+                self.stats.count("skipped")
+                self.trace.record(self._current_item.id, "skipped")
+                self._stop_current()
+        self._notify()
+        self._wake()
+
+    async def async_synthesize(
+        self, message: str, broadcast: QueCastBroadcast, language: str = "", options: str = "{}"
+    ) -> tuple[Optional[str], Optional[float]]:
+        """Synthesize a message once for every room of broadcast, returning (media URL, duration).
+
+        Cached audio stays pinned until the broadcast releases it.
+        """
+        item = QueCastQueueItem(message=message, language=language, options=options)
+        item.plan = self._plan(item)
+        broadcast.on_release(lambda: self._release(item))
+        return await self._resolve_url(message, item.plan, item)
+
+    @property
+    def instance_id(self) -> str:
+        return self._instance_id
+
+    @property
+    def media_player(self) -> str:
+        return self._media_player
+
+    @property
+    def duck_candidates(self) -> Optional[frozenset[str]]:
+        """Players this instance may duck, or None for any playing player."""
+        return self._duck_candidates
+
+    @property
+    def duck_exclude(self) -> frozenset[str]:
+        return self._duck_exclude
 
     @property
     def queue(self) -> list[QueCastQueueItem]:
+        """Snapshot of pending items in playback order; prefer queue_size."""
         return list(self._queue)
 
-    async def _queue_worker(self) -> None:
-        while True:
-            try:
-                await self._process_next_item()
-                await asyncio.sleep(1)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:  # noqa: BLE001
-                _LOGGER.exception("Queue worker error: %s", e)
-                await asyncio.sleep(5)
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    @property
+    def is_playing(self) -> bool:
+        return self._is_playing
+
+    @property
+    def current_item(self) -> Optional[QueCastQueueItem]:
+        return self._current_item
+
+    @property
+    def next_item(self) -> Optional[QueCastQueueItem]:
+        return self._queue.peek()
+
+    @property
+    def oldest_item(self) -> Optional[QueCastQueueItem]:
+        return self._queue.oldest()
+
+    def _wake(self) -> None:
+        """Ask the scheduler to step this instance; the queue or playback state changed."""
+        self._wakeup.set()
+        self._scheduler.wake(self)
+
+    def _notify(self) -> None:
+        """Tell entities the queue or playback state changed.
+
+        Changes within one event loop iteration (e.g. an enqueue burst) are
+        sent as a single dispatcher signal.
+        """
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            self._hass.loop.call_soon(self._send_update)
+
+    @callback
+    def _send_update(self) -> None:
+        self._update_scheduled = False
+        async_dispatcher_send(self._hass, SIGNAL_QUEUE_UPDATED.format(self._instance_id))
+
+    def _notify_stats(self) -> None:
+        """Tell statistics entities an item finished, was skipped or interrupted."""
+        async_dispatcher_send(self._hass, SIGNAL_STATS_UPDATED.format(self._instance_id))
 
-    async def _process_next_item(self) -> None:
+    def next_check_delay(self) -> Optional[float]:
+        """Return seconds until the scheduler should step again, None to wait for a wake."""
+        delay = self._playback_check_delay()
+        if self._expiry:
+            until_expiry = max(0.0, self._expiry[0][0] - dt_util.utcnow().timestamp()) + 0.01
+            delay = until_expiry if delay is None else min(delay, until_expiry)
+        return delay
+
+    def _playback_check_delay(self) -> Optional[float]:
+        """Return seconds until the current item should be re-checked, None to block."""
+        if not self._current_item or self._starting():
+            # The play task wakes the scheduler when it is done
+            return None
+        return self._check_delay(self._current_item)
+
+    def _check_delay(self, item: QueCastQueueItem) -> Optional[float]:
+        """Return seconds until item may have ended, None to wait for a wake."""
+        end = self._item_end(item)
+        if end is None:
+            return None
+        if self._detection_mode == "state":
+            if item.phase == "playing":
+                # The state listener wakes the scheduler on playing -> idle
+                return None
+            end += STATE_START_GUARD
+        return max(0.0, end - monotonic()) + 0.01
+
+    def _item_end(self, item: QueCastQueueItem) -> Optional[float]:
+        if item.started is None:
+            return None
+        return item.started + (item.duration or 0.0) + PLAYBACK_START_SLACK
+
+    def _starting(self) -> bool:
+        """Whether the current item's play task is still running."""
+        return self._play_task is not None and not self._play_task.done()
+
+    async def async_step(self) -> None:
+        """Advance playback: finish the current item or start the next one."""
+        # The lock only guards queue bookkeeping; service calls happen outside
+        # it so an interrupt never waits behind them
+        finished = False
         async with self._lock:
-            if not self._queue and not self._current_item:
-                self._is_playing = False
+            self._purge_expired()
+            item = self._current_item
+            if item is not None:
+                if not await self._is_current_done():
+                    return
+                self._record_completion(item)
+                self._release(item)
+                self._journal_delete(item)
+                self._current_item = None
+                finished = True
+            elif self._queue:
+                item = self._current_item = self._pop_next()
+                queue_wait = (dt_util.utcnow() - item.timestamp).total_seconds()
+                self.stats.record("queue_wait", queue_wait)
+                self.trace.record(item.id, "started", queue_wait_ms=round(queue_wait * 1000, 1))
+                self._forget_pending(item)
+                if self._batch_max_items > 1:
+                    # Usually already batched by the look-ahead; this covers look-ahead 0
+                    self._batch_followers(item, self._queue.head(self._batch_max_items - 1))
+                self._schedule_lookahead()
+                self._is_playing = True
+                self._notify()
+                self._play_task = self._hass.async_create_task(self._async_play(item))
                 return
 
-            if self._current_item:
-                if await self._is_current_done():
-                    await self._finish_current()
-                return
+        if finished:
+            await self._finish_current()
+        elif self._is_playing or self._scheduler.is_ducking(self):
+            # The current item was skipped or interrupted and the queue drained
+            self._is_playing = False
+            await self._async_wait_stopped()
+            with self.stats.time("restore"):
+                await self._restore_volumes()
+            self._notify()
+
+    def _pop_next(self) -> QueCastQueueItem:
+        """Pop the next item, keeping a started contiguous group together."""
+        group = self._active_group
+        while group and not group[0].queued:
+            # Dropped, expired or cleared members
+            group.popleft()
+        # Pending interrupting items are always at the head
+        head = self._queue.peek()
+        if group and not head.interrupt:
+            item = group.popleft()
+            self._queue.remove(item)
+            return item
+        item = self._queue.pop()
+        if item.group is not None:
+            self._active_group = deque(
+                member for member in item.group if member is not item and member.queued
+            )
+        return item
+
+    def _batch_followers(self, item: QueCastQueueItem, followers: list[QueCastQueueItem]) -> None:
+        """Fold compatible low-priority items queued behind item into one utterance.
 
-            if self._queue:
-                self._current_item = self._queue.pop(0)
+        followers are the pending items after item, in playback order. Only
+        messages at priority 0 or below are batched so urgent ones keep their
+        own slot; the batch shares a single duck/volume/restore cycle. Items
+        whose audio is already being prepared are left alone so no synthesis
+        is thrown away; the batch is normally formed by the look-ahead, before
+        anything is synthesized.
+        """
+        if not _batchable(item) or item.id in self._prepared:
+            return
+        parts = [item.message]
+        chars = len(item.message)
+        for nxt in followers:
+            if len(parts) >= self._batch_max_items:
+                break
+            if not nxt.queued or not _batchable(nxt) or _playback_key(nxt) != _playback_key(item):
+                break
+            if nxt.id in self._prepared or chars + 1 + len(nxt.message) > self._batch_max_chars:
+                break
+            self._queue.remove(nxt)
+            self._forget_pending(nxt)
+            self._journal_delete(nxt)
+            self.trace.record(nxt.id, "batched", into=item.id)
+            parts.append(nxt.message)
+            chars += 1 + len(nxt.message)
+
+        if len(parts) > 1:
+            self._forget_pending(item)
+            item.message = _join_messages(parts)
+            item.plan = self._plan(item)
+            item.duration = None
+            self._journal_put(item)
+            _LOGGER.debug("Batched %d messages into item %s", len(parts), item.id)
+
+    def _schedule_lookahead(self) -> None:
+        """Start synthesizing the next items while the current one plays."""
+        if self._lookahead > 0:
+            group = (member for member in self._active_group if member.queued)
+            # Enough items to see the followers each upcoming item may batch
+            window = self._lookahead * self._batch_max_items
+            upcoming = [*itertools.islice(group, self._lookahead), *self._queue.head(window)]
+            prepared = 0
+            for i, item in enumerate(upcoming):
+                if prepared >= self._lookahead:
+                    break
+                if not item.queued:
+                    # Folded into an item before it
+                    continue
+                if self._batch_max_items > 1:
+                    # Batch before synthesizing so the joined text is what gets prepared
+                    self._batch_followers(item, upcoming[i + 1:])
+                if item.media_url is None:
+                    self._prepare(item)
+                prepared += 1
+
+    def _prepare(self, item: QueCastQueueItem) -> asyncio.Task:
+        task = self._prepared.get(item.id)
+        if task is None:
+            task = self._hass.async_create_task(self._resolve_item_url(item))
+            self._prepared[item.id] = task
+        return task
+
+    def _cancel_prepared(self, item: Optional[QueCastQueueItem] = None) -> None:
+        if item is None:
+            tasks = list(self._prepared.values())
+            self._prepared.clear()
+        else:
+            task = self._prepared.pop(item.id, None)
+            tasks = [task] if task else []
+        for task in tasks:
+            task.cancel()
+        self._release(item)
+
+    def _cached_url(self, entry: QueCastCacheEntry, item: Optional[QueCastQueueItem]) -> str:
+        """Return the URL of a cache entry, pinned for item until it is released."""
+        if item is not None:
+            self.audio_cache.pin(entry.key)
+            self._pinned.setdefault(item.id, []).append(entry.key)
+        return AUDIO_URL.format(instance_id=self._instance_id, filename=entry.filename)
+
+    def _release(self, item: Optional[QueCastQueueItem] = None) -> None:
+        """Unpin the cached audio of item, or of every item.
+
+        A broadcast item also lets go of the audio shared by its rooms.
+        """
+        if item is None:
+            keys = [key for keys in self._pinned.values() for key in keys]
+            self._pinned.clear()
+        else:
+            keys = self._pinned.pop(item.id, [])
+            if item.broadcast is not None:
+                broadcast, item.broadcast = item.broadcast, None
+                broadcast.release()
+        for key in keys:
+            self.audio_cache.unpin(key)
+
+    async def _resolve_item_url(
+        self, item: QueCastQueueItem
+    ) -> tuple[Optional[str], Optional[float]]:
+        """Resolve item, or the first chunk of a chunked item, to (media URL, duration).
+
+        With the audio cache, the pre-roll sound is joined in front of the
+        speech when the two can be joined.
+        """
+        plan = item.plan
+        message = plan.chunks[0] if plan.chunks else item.message
+        item.pre_rolled = False
+        if self._pre_roll_sound and self.audio_cache is not None:
+            try:
+                resolved = await self._resolve_pre_rolled_url(message, plan, item)
+            except Exception as e:  # noqa: BLE001
+                _LOGGER.warning("Pre-synthesis failed, falling back to TTS service: %s", e)
+                return None, None
+            if resolved is not None:
+                item.pre_rolled = True
+                return resolved
+        return await self._resolve_url(message, plan, item)
+
+    async def _resolve_pre_rolled_url(
+        self, message: str, plan: QueCastPlaybackPlan, item: QueCastQueueItem
+    ) -> Optional[tuple[str, Optional[float]]]:
+        """Resolve the pre-roll sound followed by message as one cached file.
 
-        if self._current_item:
-            await self._play_current_item()
+        Returns None if they cannot be joined; speech synthesized anyway is
+        cached on its own so it is not synthesized twice.
+        """
+        options = dict(plan.options)
+        key = cache_key(self._tts_engine, plan.language, options, message, self._pre_roll_sound)
+        entry = self.audio_cache.get(key)
+        if entry is None:
+            pre_roll = await self._async_pre_roll_audio()
+            if pre_roll is None:
+                return None
+            audio = await async_synthesize(
+                self._hass, self._tts_engine, message, plan.language, options
+            )
+            if audio is None:
+                return None
+            extension, data = audio
+            duration = audio_duration(data, extension)
+            joined = join_audio(pre_roll[:2], audio)
+            if joined is None:
+                _LOGGER.debug("Cannot join %s pre-roll to %s speech", pre_roll[0], extension)
+                await self.audio_cache.async_put(
+                    cache_key(self._tts_engine, plan.language, options, message),
+                    extension, data, duration,
+                )
+                return None
+            if duration is not None and pre_roll[2] is not None:
+                duration += pre_roll[2]
+            entry = await self.audio_cache.async_put(key, joined[0], joined[1], duration)
+        return self._cached_url(entry, item), entry.duration
+
+    async def _async_pre_roll_audio(self) -> Optional[tuple[str, bytes, Optional[float]]]:
+        """Return the pre-roll sound as (extension, bytes, duration), fetched once."""
+        if self._pre_roll_task is None:
+            self._pre_roll_task = self._hass.async_create_task(self._async_fetch_pre_roll())
+        # Shared by every item; one cancelled synthesis must not cancel it
+        return await asyncio.shield(self._pre_roll_task)
 
-    async def _play_current_item(self) -> None:
-        self._is_playing = True
-        volume = self._get_current_volume(self._current_item.volume)
+    async def _async_fetch_pre_roll(self) -> Optional[tuple[str, bytes, Optional[float]]]:
+        try:
+            audio = await async_fetch_audio(self._hass, self._pre_roll_sound)
+        except Exception as e:  # noqa: BLE001
+            _LOGGER.warning(
+                "Cannot fetch pre-roll sound %s, playing it separately: %s", self._pre_roll_sound, e
+            )
+            return None
+        if audio is None or audio[0] not in ("mp3", "wav"):
+            _LOGGER.debug("Pre-roll sound %s cannot be joined, playing it separately", self._pre_roll_sound)
+            return None
+        extension, data = audio
+        return extension, data, audio_duration(data, extension)
+
+    async def _resolve_url(
+        self, message: str, plan: QueCastPlaybackPlan, item: Optional[QueCastQueueItem] = None
+    ) -> tuple[Optional[str], Optional[float]]:
+        """Resolve message to (media URL, duration); a cached URL is pinned for item."""
+        options = dict(plan.options)
+        try:
+            if self.audio_cache is None:
+                media_url = await async_resolve_media_url(
+                    self._hass,
+                    self._tts_engine,
+                    message,
+                    plan.language,
+                    options,
+                    self._media_player,
+                )
+                return media_url, None
+
+            key = cache_key(self._tts_engine, plan.language, options, message)
+            entry = self.audio_cache.get(key)
+            if entry is None:
+                audio = await async_synthesize(
+                    self._hass, self._tts_engine, message, plan.language, options
+                )
+                if audio is None:
+                    return None, None
+                extension, data = audio
+                entry = await self.audio_cache.async_put(
+                    key, extension, data, audio_duration(data, extension)
+                )
+            return self._cached_url(entry, item), entry.duration
+        except Exception as e:  # noqa: BLE001
+            _LOGGER.warning("Pre-synthesis failed, falling back to TTS service: %s", e)
+            return None, None
+
+    async def _async_play(self, item: QueCastQueueItem) -> None:
+        """Start playing item; runs as a task so an interrupt can cancel it at any step."""
+        try:
+            await self._play_item(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # noqa: BLE001
+            self.stats.count("failed")
+            self.trace.record(item.id, "error", error=str(e))
+            _LOGGER.exception("Playback error: %s", e)
+            # Nothing is playing; let the next step move on
+            item.failed = True
+            item.started = monotonic()
+            item.duration = 0.0
+            item.phase = "ended"
+        finally:
+            # Cancelled along with this task if it was still synthesizing
+            self._prepared.pop(item.id, None)
+            if self._current_item is not item:
+                # Interrupted; audio resolved before the cancellation is not needed
+                self._release(item)
+            self._wake()
+
+    async def _play_item(self, item: QueCastQueueItem) -> None:
+        volume = item.plan.volume
+        # Shared broadcast audio is always played whole
+        chunks = item.plan.chunks if item.media_url is None else ()
+
+        # Wait for synthesis before ducking so other players are not held down.
+        # Cancelling this task on interrupt also cancels the synthesis.
+        media_url = item.media_url
+        duration = None
+        if media_url is None and (chunks or self._lookahead > 0 or self.audio_cache is not None):
+            with self.stats.time("synthesis"):
+                media_url, duration = await self._prepare(item)
+            self._prepared.pop(item.id, None)
+            if duration is not None and not chunks:
+                item.duration = duration
+
+        # An interrupted item must be silenced before this one starts
+        await self._async_wait_stopped()
 
         # Set volume and duck others
         if self._ducking_enabled:
-            await self._duck_other_players(volume)
-        await self._hass.services.async_call(
-            "media_player", "volume_set",
-            {"entity_id": self._media_player, "volume_level": volume},
-            blocking=True,
-        )
+            with self.stats.time("duck"):
+                await self.trace.async_call(item.id, "duck", self._scheduler.async_duck(self))
+        with self.stats.time("volume_set"):
+            await self.trace.async_call(
+                item.id, "volume_set", self._commands.async_set_volume(self._media_player, volume)
+            )
+
+        with self.stats.time("pre_roll"):
+            # A pre-roll joined into the audio needs no call and no wait of its own
+            if not item.pre_rolled:
+                if self._pre_roll_sound:
+                    await self.trace.async_call(item.id, "pre_roll", self._play_pre_roll())
+                await asyncio.sleep(self._pre_roll_ms / 1000.0)
+
+        if item.broadcast is not None:
+            await item.broadcast.async_wait_ready()
+
+        if item.interrupt:
+            self.stats.record("interrupt", (dt_util.utcnow() - item.timestamp).total_seconds())
+        if chunks:
+            await self._play_chunks(item, media_url, duration)
+            return
+        reported = await self._async_speak(item, item.message, media_url)
+        if item.duration is None:
+            item.duration = reported or estimate_duration(
+                item.message, self._tts_engine, item.plan.language
+            )
 
-        if self._pre_roll_sound:
-            await self._play_pre_roll()
-        await asyncio.sleep(self._pre_roll_ms / 1000.0)
+    async def _play_chunks(
+        self, item: QueCastQueueItem, media_url: Optional[str], duration: Optional[float]
+    ) -> None:
+        """Speak a chunked item, synthesizing each chunk while the one before plays.
 
+        The chunks before the last are followed here; the item then covers
+        everything from the first chunk's start so the end of the last one
+        is detected like that of any other item.
+        """
+        chunks = item.plan.chunks
+        first_start = None
+        next_task: Optional[asyncio.Task] = None
         try:
-            # Parse engine "tts.speak" -> domain="tts", service="speak"
-            engine = self._tts_engine
-            if "." in engine:
-                domain, service = engine.split(".", 1)
-            else:
-                domain, service = "tts", engine
+            for i, chunk in enumerate(chunks):
+                if next_task is not None:
+                    media_url, duration = await next_task
+                    next_task = None
+                last = i == len(chunks) - 1
+                if not last:
+                    next_task = self._hass.async_create_task(
+                        self._resolve_url(chunks[i + 1], item.plan, item)
+                    )
+                reported = await self._async_speak(item, chunk, media_url)
+                if first_start is None:
+                    first_start = item.started
+                item.duration = duration or reported or estimate_duration(
+                    chunk, self._tts_engine, item.plan.language
+                )
+                if not last:
+                    await self._async_wait_played(item)
+        finally:
+            if next_task is not None:
+                next_task.cancel()
+        item.duration += item.started - first_start
+        item.started = first_start
 
-            service_data = {"message": self._current_item.message, "cache": False}
+    async def _async_speak(
+        self, item: QueCastQueueItem, message: str, media_url: Optional[str]
+    ) -> Optional[float]:
+        """Play media_url on the player, or have the TTS service speak message.
 
-            if self._current_item.language:
-                service_data["language"] = self._current_item.language
+        Returns the duration the player reports for this media, if it has
+        already reported it.
+        """
+        # Only states reported from here on belong to this item
+        item.phase = "starting"
+        tts_start = monotonic()
+        requested = dt_util.utcnow()
+        content_id = None
+        # A failed call fails the item in _async_play; nothing plays to wait for
+        if media_url:
+            content_id = async_process_play_media_url(self._hass, media_url)
+            await self.trace.async_call(
+                item.id,
+                "play_media",
+                self._commands.async_play_media(self._media_player, content_id),
+            )
+        else:
+            plan = item.plan
+            service_data = dict(plan.service_data)
+            service_data["message"] = message
+            await self.trace.async_call(
+                item.id,
+                f"{plan.domain}.{plan.service}",
+                self._commands.async_call(plan.domain, plan.service, service_data),
+            )
+        item.started = monotonic()
+        self.stats.record("tts", item.started - tts_start)
+        return self._player_media_duration(requested, content_id)
 
+    async def _async_wait_played(self, item: QueCastQueueItem) -> None:
+        """Wait until the chunk item is playing has ended."""
+        while not self._has_played(item):
+            self._wakeup.clear()
             try:
-                opts = json.loads(self._current_item.options or self._default_options)
-                if isinstance(opts, dict):
-                    service_data.update(opts)
-            except json.JSONDecodeError:
+                await asyncio.wait_for(self._wakeup.wait(), self._check_delay(item))
+            except asyncio.TimeoutError:
                 pass
 
-            # 'tts.speak' uses 'media_player_entity_id'; legacy TTS uses 'entity_id'
-            key = "media_player_entity_id" if service == "speak" else "entity_id"
-            service_data[key] = self._media_player
+    def _player_media_duration(
+        self, requested: datetime, content_id: Optional[str]
+    ) -> Optional[float]:
+        """Return the player's media_duration if it describes the media requested.
 
-            await self._hass.services.async_call(domain, service, service_data, blocking=True)
-        except Exception as e:  # noqa: BLE001
-            _LOGGER.exception("TTS error: %s", e)
+        Players often still report the previous track right after the call
+        returns, so the state must name the new media or be newer than the
+        request.
+        """
+        state = self._hass.states.get(self._media_player)
+        if state is None or state.state != "playing":
+            return None
+        reported_id = state.attributes.get("media_content_id")
+        if content_id is not None and reported_id is not None:
+            if reported_id != content_id:
+                return None
+        elif state.last_updated < requested:
+            return None
+        duration = state.attributes.get("media_duration")
+        return float(duration) if duration else None
 
     async def _is_current_done(self) -> bool:
+        return not self._starting() and self._has_played(self._current_item)
+
+    def _has_played(self, item: QueCastQueueItem) -> bool:
+        end = self._item_end(item)
         if self._detection_mode == "state":
-            state = self._hass.states.get(self._media_player)
-            return bool(state and state.state in {"idle", "off", "paused"})
-        # timer fallback (simple)
-        if self._current_item and self._current_item.timestamp:
-            elapsed = (dt_util.utcnow() - self._current_item.timestamp).total_seconds()
-            return elapsed > 5.0
-        return False
+            phase = item.phase
+            if phase == "ended":
+                return True
+            # Guard for players that never report "playing"
+            return phase != "playing" and end is not None and monotonic() >= end + STATE_START_GUARD
+        # timer: real playback start plus the audio duration
+        return end is not None and monotonic() >= end
+
+    @callback
+    def _async_player_state_changed(self, event: Event) -> None:
+        """Track the playing -> idle transition of the current item."""
+        item = self._current_item
+        new_state = event.data.get("new_state")
+        if item is None or new_state is None or item.phase not in ("starting", "playing"):
+            return
+        if new_state.state == "playing":
+            item.phase = "playing"
+        elif item.phase == "playing" and new_state.state in DONE_STATES:
+            item.phase = "ended"
+            self._wake()
+
+    def _record_completion(self, item: QueCastQueueItem) -> None:
+        if item.failed:
+            # Counted and traced when it failed
+            return
+        now = monotonic()
+        self.stats.count("played")
+        self.trace.record(
+            item.id,
+            "completed",
+            playback_ms=round((now - item.started) * 1000, 1) if item.started is not None else None,
+        )
+        if item.started is not None:
+            self.stats.record("playback", now - item.started)
+            expected_end = item.started + (item.duration or 0.0)
+            self.stats.record("completion_lag", max(0.0, now - expected_end))
 
     async def _finish_current(self) -> None:
-        if self._ducking_enabled:
-            await self._restore_volumes()
-        await asyncio.sleep(self._post_grace_ms / 1000.0)
-        self._current_item = None
+        # Back-to-back items share one ducking cycle; restore once the queue drains
+        if not self._queue:
+            with self.stats.time("restore"):
+                await self._restore_volumes()
+        await self._async_post_grace()
         self._is_playing = False
+        self._notify()
+        self._notify_stats()
+        self._wake()
+
+    async def _async_post_grace(self) -> None:
+        """Wait the gap after an item, cut short when an interrupting item arrives."""
+        deadline = monotonic() + self._post_grace_ms / 1000.0
+        while (remaining := deadline - monotonic()) > 0:
+            nxt = self._queue.peek()
+            if nxt is not None and nxt.interrupt:
+                return
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
 
-    async def _stop_current(self) -> None:
-        await self._hass.services.async_call(
-            "media_player", "media_stop",
-            {"entity_id": self._media_player},
-            blocking=True,
+    async def _async_wait_stopped(self) -> None:
+        if self._stop_task is None:
+            return
+        stop_task, self._stop_task = self._stop_task, None
+        try:
+            await stop_task
+        except Exception as e:  # noqa: BLE001
+            _LOGGER.warning("Stopping interrupted playback failed: %s", e)
+
+    def _stop_current(self) -> None:
+        """Abandon the current item at once, without waiting on any service call.
+
+        Its start-up task is cancelled wherever it is (synthesis, ducking,
+        the TTS call) and the player is stopped in the background; the next
+        item waits for that stop before it plays. Other players stay ducked
+        until the queue drains.
+        """
+        item_id = self._current_item.id
+        self._journal_delete(self._current_item)
+        self._release(self._current_item)
+        self._current_item = None
+        if self._play_task is not None and not self._play_task.done():
+            self._play_task.cancel()
+        self._play_task = None
+        self._stop_task = self._hass.async_create_task(
+            self.trace.async_call(item_id, "media_stop", self._commands.async_stop(self._media_player))
         )
-        if self._ducking_enabled:
-            await self._restore_volumes()
-        self._is_playing = False
+        self._notify_stats()
 
     async def _play_pre_roll(self) -> None:
-        await self._hass.services.async_call(
-            "media_player", "play_media",
-            {
-                "entity_id": self._media_player,
-                "media_content_id": self._pre_roll_sound,
-                "media_content_type": "music",
-            },
-            blocking=True,
-        )
+        await self._commands.async_play_media(self._media_player, self._pre_roll_sound)
 
     def _get_current_volume(self, override: Optional[float]) -> float:
         if override is not None:
@@ -245,22 +1321,5 @@ class QueCastQueueManager:
             quiet = now >= self._quiet_start or now <= self._quiet_end
         return self._night_volume if quiet else self._day_volume
 
-    async def _duck_other_players(self, tts_volume: float) -> None:
-        self._original_volumes.clear()
-        for entity in self._hass.states.async_all("media_player"):
-            if entity.entity_id != self._media_player and entity.state == "playing":
-                volume_level = float(entity.attributes.get("volume_level", 0.5))
-                self._original_volumes[entity.entity_id] = volume_level
-                ducked = max(0.1, volume_level * 0.3)
-                await self._hass.services.async_call(
-                    "media_player", "volume_set",
-                    {"entity_id": entity.entity_id, "volume_level": ducked}
-                )
-
     async def _restore_volumes(self) -> None:
-        for entity_id, volume_level in self._original_volumes.items():
-            await self._hass.services.async_call(
-                "media_player", "volume_set",
-                {"entity_id": entity_id, "volume_level": volume_level}
-            )
-        self._original_volumes.clear()
+        await self.trace.async_call(None, "restore", self._scheduler.async_release(self))
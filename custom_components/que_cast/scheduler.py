@@ -0,0 +1,235 @@
+"""Shared scheduler for all Que Cast instances."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+
+from .commands import QueCastPlayerCommands
+from .const import DATA_SCHEDULER
+
+if TYPE_CHECKING:
+    from .queue_manager import QueCastQueueManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay before retrying an instance whose step raised
+ERROR_RETRY_DELAY = 5.0
+
+
+def _volume_level(state) -> float:
+    volume_level = state.attributes.get("volume_level")
+    return float(volume_level) if volume_level is not None else 0.5
+
+
+@callback
+def get_scheduler(hass: HomeAssistant) -> QueCastScheduler:
+    """Return the scheduler shared by every instance, creating it on first use."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = QueCastScheduler(hass)
+    return scheduler
+
+
+class QueCastScheduler:
+    """Drives every instance from one task and owns ducking across instances.
+
+    Instances ask to be stepped (``wake``) or to be re-checked after a delay
+    (timers live in a single heap); the loop runs each due instance's step as
+    a short task, never two steps of one instance at once, so a slow room does
+    not hold up the others. Ducking is one shared volume plan: a player is
+    ducked once however many instances are speaking, never while it is itself
+    an announcement target, and restored to its real volume when the last
+    instance using it releases it. The playing players and their volumes are
+    kept in an index updated from state-change events, so ducking only looks
+    at players that are actually playing.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+        self.commands = QueCastPlayerCommands(hass)
+        self._managers: set[QueCastQueueManager] = set()
+        # Instances to step, in wake order
+        self._ready: dict[QueCastQueueManager, None] = {}
+        self._running: dict[QueCastQueueManager, asyncio.Task] = {}
+        # (when, seq, manager); an entry is live only if it matches _due
+        self._timers: list[tuple[float, int, QueCastQueueManager]] = []
+        self._due: dict[QueCastQueueManager, float] = {}
+        self._seq = itertools.count()
+        self._event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # entity id -> volume before ducking, and the instances holding the duck
+        self._ducked: dict[str, float] = {}
+        self._holders: dict[str, set[QueCastQueueManager]] = {}
+        # entity id -> volume before ducking of a ducked player that became an
+        # announcement target; restored when its own announcements finish
+        self._lent: dict[str, float] = {}
+        self._duck_lock = asyncio.Lock()
+        # entity id -> volume level of every playing media player
+        self._playing: dict[str, float] = {}
+        self._unsub_states: Optional[CALLBACK_TYPE] = None
+
+    def register(self, manager: QueCastQueueManager) -> None:
+        self._managers.add(manager)
+        if self._unsub_states is None:
+            self._unsub_states = async_track_state_change_filtered(
+                self._hass,
+                TrackStates(False, set(), {"media_player"}),
+                self._async_media_player_changed,
+            ).async_remove
+            self._playing = {
+                state.entity_id: _volume_level(state)
+                for state in self._hass.states.async_all("media_player")
+                if state.state == "playing"
+            }
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(self._run(), "que_cast scheduler")
+        self.wake(manager)
+
+    async def async_unregister(self, manager: QueCastQueueManager) -> None:
+        self._managers.discard(manager)
+        self._ready.pop(manager, None)
+        self._due.pop(manager, None)
+        if (task := self._running.get(manager)) is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.async_release(manager)
+        if not self._managers:
+            if self._unsub_states is not None:
+                self._unsub_states()
+                self._unsub_states = None
+                self._playing.clear()
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
+                self._timers.clear()
+
+    @callback
+    def _async_media_player_changed(self, event: Event) -> None:
+        new_state = event.data["new_state"]
+        if new_state is None or new_state.state != "playing":
+            self._playing.pop(event.data["entity_id"], None)
+        else:
+            self._playing[new_state.entity_id] = _volume_level(new_state)
+
+    @callback
+    def wake(self, manager: QueCastQueueManager) -> None:
+        """Step manager as soon as possible."""
+        if manager in self._managers:
+            self._ready[manager] = None
+            self._event.set()
+
+    @callback
+    def _schedule(self, manager: QueCastQueueManager, delay: float) -> None:
+        when = self._hass.loop.time() + delay
+        self._due[manager] = when
+        heapq.heappush(self._timers, (when, next(self._seq), manager))
+        if self._timers[0][2] is manager:
+            self._event.set()
+
+    async def _run(self) -> None:
+        loop = self._hass.loop
+        while True:
+            self._event.clear()
+            now = loop.time()
+            timers = self._timers
+            while timers and timers[0][0] <= now:
+                when, _, manager = heapq.heappop(timers)
+                if self._due.get(manager) == when:
+                    del self._due[manager]
+                    self._ready[manager] = None
+            # Drop timers superseded by a newer one
+            if len(timers) > 2 * len(self._due) + 32:
+                self._timers = timers = [t for t in timers if self._due.get(t[2]) == t[0]]
+                heapq.heapify(timers)
+
+            for manager in list(self._ready):
+                if manager not in self._running:
+                    del self._ready[manager]
+                    self._due.pop(manager, None)
+                    self._running[manager] = self._hass.async_create_background_task(
+                        self._step(manager), f"que_cast step {manager.instance_id}"
+                    )
+
+            timeout = max(0.0, timers[0][0] - now) if timers else None
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _step(self, manager: QueCastQueueManager) -> None:
+        delay: Optional[float]
+        try:
+            await manager.async_step()
+            delay = manager.next_check_delay()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # noqa: BLE001
+            _LOGGER.exception("Queue worker error: %s", e)
+            manager.trace.record(None, "error", error=str(e))
+            delay = ERROR_RETRY_DELAY
+        finally:
+            self._running.pop(manager, None)
+        if manager not in self._managers:
+            return
+        if delay is not None:
+            self._schedule(manager, delay)
+        if manager in self._ready:
+            # Woken while stepping
+            self._event.set()
+
+    def is_ducking(self, manager: QueCastQueueManager) -> bool:
+        return any(manager in holders for holders in self._holders.values())
+
+    async def async_duck(self, manager: QueCastQueueManager) -> None:
+        """Duck every playing player that is not an active announcement target."""
+        async with self._duck_lock:
+            targets = {m.media_player for m in self._managers if m.is_playing}
+            targets.add(manager.media_player)
+            # A player now speaking an announcement gets its own volume; its
+            # real volume is kept for when it has finished
+            for entity_id in targets & self._ducked.keys():
+                self._lent[entity_id] = self._ducked.pop(entity_id)
+                del self._holders[entity_id]
+
+            candidates = manager.duck_candidates
+            playing = self._playing
+            entity_ids = playing.keys() if candidates is None else candidates & playing.keys()
+            exclude = manager.duck_exclude
+            ducked: dict[str, float] = {}
+            for entity_id in entity_ids:
+                if entity_id in targets or entity_id in exclude:
+                    continue
+                if entity_id not in self._ducked:
+                    volume_level = playing[entity_id]
+                    self._ducked[entity_id] = volume_level
+                    self._holders[entity_id] = set()
+                    ducked[entity_id] = max(0.1, volume_level * 0.3)
+                self._holders[entity_id].add(manager)
+            await self.commands.async_set_volumes(ducked)
+
+    async def async_release(self, manager: QueCastQueueManager) -> None:
+        """Restore players no other instance still needs ducked."""
+        async with self._duck_lock:
+            restore: dict[str, float] = {}
+            for entity_id, holders in list(self._holders.items()):
+                holders.discard(manager)
+                if not holders:
+                    restore[entity_id] = self._ducked.pop(entity_id)
+                    del self._holders[entity_id]
+            entity_id = manager.media_player
+            if entity_id in self._lent and not any(
+                m.is_playing and m.media_player == entity_id for m in self._managers if m is not manager
+            ):
+                # Its own announcements are over; the announcement replaced
+                # what it was playing, so it has nothing left to duck
+                restore[entity_id] = self._lent.pop(entity_id)
+            await self.commands.async_set_volumes(restore)
@@ -1,32 +1,173 @@
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_STATS_UPDATED
+from .entity import QueCastEntity
+from .stats import STAGES
 
+COUNTERS = ("played", "failed", "interrupted", "skipped", "dropped", "rejected", "expired")
 
-class QueCastQueueSizeSensor(SensorEntity):
+
+class QueCastQueueSizeSensor(QueCastEntity, SensorEntity):
     _attr_icon = "mdi:playlist-queue"
     _attr_native_unit_of_measurement = "items"
 
     def __init__(self, hass: HomeAssistant, instance_id: str, config: dict):
-        self._hass = hass
-        self._instance_id = instance_id
+        super().__init__(hass, instance_id, config)
         self._attr_name = f"Que Cast {config['name']} Queue Size"
         self._attr_unique_id = f"{instance_id}_queue_size"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, instance_id)},
-            "name": config["name"],
-            "manufacturer": "Que Cast",
+
+    @property
+    def native_value(self):
+        return self._queue_manager.queue_size
+
+
+class QueCastCurrentItemSensor(QueCastEntity, SensorEntity):
+    """Message currently being spoken."""
+
+    _attr_icon = "mdi:account-voice"
+
+    def __init__(self, hass: HomeAssistant, instance_id: str, config: dict):
+        super().__init__(hass, instance_id, config)
+        self._attr_name = f"Que Cast {config['name']} Current Message"
+        self._attr_unique_id = f"{instance_id}_current_message"
+
+    @property
+    def native_value(self):
+        item = self._queue_manager.current_item
+        # State values are capped at 255 characters
+        return item.message[:255] if item is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        item = self._queue_manager.current_item
+        if item is None:
+            return {}
+        return {
+            "id": item.id,
+            "priority": item.priority,
+            "language": item.language,
+            "enqueued": item.timestamp.isoformat(),
         }
 
+
+class QueCastHighestPrioritySensor(QueCastEntity, SensorEntity):
+    """Priority of the next pending item, which is always the highest."""
+
+    _attr_icon = "mdi:sort-numeric-descending"
+
+    def __init__(self, hass: HomeAssistant, instance_id: str, config: dict):
+        super().__init__(hass, instance_id, config)
+        self._attr_name = f"Que Cast {config['name']} Highest Pending Priority"
+        self._attr_unique_id = f"{instance_id}_highest_priority"
+
+    @property
+    def native_value(self):
+        item = self._queue_manager.next_item
+        return item.priority if item is not None else None
+
+
+class QueCastOldestPendingSensor(QueCastEntity, SensorEntity):
+    """Enqueue time of the oldest pending item; the frontend shows its age."""
+
+    _attr_icon = "mdi:timer-sand"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, hass: HomeAssistant, instance_id: str, config: dict):
+        super().__init__(hass, instance_id, config)
+        self._attr_name = f"Que Cast {config['name']} Oldest Pending"
+        self._attr_unique_id = f"{instance_id}_oldest_pending"
+
+    @property
+    def native_value(self):
+        item = self._queue_manager.oldest_item
+        return item.timestamp if item is not None else None
+
+
+class QueCastCacheCounterSensor(QueCastEntity, SensorEntity):
+    """Hit or miss counter of the synthesized-audio cache."""
+
+    _attr_icon = "mdi:cached"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _signal = SIGNAL_STATS_UPDATED
+
+    def __init__(self, hass: HomeAssistant, instance_id: str, config: dict, counter: str):
+        super().__init__(hass, instance_id, config)
+        self._counter = counter
+        self._attr_name = f"Que Cast {config['name']} Cache {counter.capitalize()}"
+        self._attr_unique_id = f"{instance_id}_cache_{counter}"
+
+    @property
+    def native_value(self):
+        return getattr(self._queue_manager.audio_cache, self._counter)
+
+    @property
+    def extra_state_attributes(self):
+        cache = self._queue_manager.audio_cache
+        return {"entries": cache.size, "bytes": cache.total_bytes}
+
+
+class QueCastStageLatencySensor(QueCastEntity, SensorEntity):
+    """p95 latency of one playback stage, with p50/p99 as attributes."""
+
+    _attr_icon = "mdi:timer-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _signal = SIGNAL_STATS_UPDATED
+
+    def __init__(self, hass: HomeAssistant, instance_id: str, config: dict, stage: str):
+        super().__init__(hass, instance_id, config)
+        self._stage = stage
+        self._attr_name = f"Que Cast {config['name']} {stage.replace('_', ' ').capitalize()} Latency"
+        self._attr_unique_id = f"{instance_id}_latency_{stage}"
+
+    @property
+    def native_value(self):
+        return self._queue_manager.stats.percentiles(self._stage).get("p95")
+
+    @property
+    def extra_state_attributes(self):
+        return self._queue_manager.stats.percentiles(self._stage)
+
+
+class QueCastEventCounterSensor(QueCastEntity, SensorEntity):
+    """Count of played, failed, interrupted, skipped, dropped, rejected or expired items."""
+
+    _attr_icon = "mdi:counter"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _signal = SIGNAL_STATS_UPDATED
+
+    def __init__(self, hass: HomeAssistant, instance_id: str, config: dict, counter: str):
+        super().__init__(hass, instance_id, config)
+        self._counter = counter
+        self._attr_name = f"Que Cast {config['name']} Items {counter.capitalize()}"
+        self._attr_unique_id = f"{instance_id}_items_{counter}"
+
     @property
     def native_value(self):
-        queue_manager = self._hass.data[DOMAIN][self._instance_id]["queue_manager"]
-        return len(queue_manager.queue)
+        return self._queue_manager.stats.counters[self._counter]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     instance_id = entry.entry_id
     config = hass.data[DOMAIN][instance_id]["config"]
-    async_add_entities([QueCastQueueSizeSensor(hass, instance_id, config)])
+    entities = [
+        QueCastQueueSizeSensor(hass, instance_id, config),
+        QueCastCurrentItemSensor(hass, instance_id, config),
+        QueCastHighestPrioritySensor(hass, instance_id, config),
+        QueCastOldestPendingSensor(hass, instance_id, config),
+    ]
+    if hass.data[DOMAIN][instance_id]["queue_manager"].audio_cache is not None:
+        entities += [
+            QueCastCacheCounterSensor(hass, instance_id, config, "hits"),
+            QueCastCacheCounterSensor(hass, instance_id, config, "misses"),
+        ]
+    entities += [QueCastStageLatencySensor(hass, instance_id, config, stage) for stage in STAGES]
+    entities += [QueCastEventCounterSensor(hass, instance_id, config, counter) for counter in COUNTERS]
+    async_add_entities(entities)
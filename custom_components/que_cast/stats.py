@@ -0,0 +1,59 @@
+"""Latency statistics for Que Cast."""
+from __future__ import annotations
+
+from collections import Counter, deque
+from contextlib import contextmanager
+from time import monotonic
+from typing import Iterator
+
+# Playback stages timed per item, in the order they happen; "interrupt"
+# is enqueue-to-TTS-call time of interrupting items
+STAGES = (
+    "queue_wait",
+    "synthesis",
+    "duck",
+    "volume_set",
+    "pre_roll",
+    "tts",
+    "playback",
+    "completion_lag",
+    "restore",
+    "interrupt",
+)
+
+SAMPLE_WINDOW = 500
+
+
+class QueCastStats:
+    """Rolling per-stage latency samples and event counters for one instance."""
+
+    def __init__(self, window: int = SAMPLE_WINDOW) -> None:
+        self._samples: dict[str, deque[float]] = {
+            stage: deque(maxlen=window) for stage in STAGES
+        }
+        self.counters: Counter[str] = Counter()
+
+    def record(self, stage: str, seconds: float) -> None:
+        self._samples[stage].append(seconds)
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        start = monotonic()
+        try:
+            yield
+        finally:
+            self._samples[stage].append(monotonic() - start)
+
+    def count(self, counter: str, n: int = 1) -> None:
+        self.counters[counter] += n
+
+    def percentiles(self, stage: str) -> dict[str, float]:
+        """Return p50/p95/p99 in milliseconds over the rolling window."""
+        samples = sorted(self._samples[stage])
+        if not samples:
+            return {}
+        last = len(samples) - 1
+        return {
+            f"p{p}": round(samples[min(last, int(len(samples) * p / 100))] * 1000, 1)
+            for p in (50, 95, 99)
+        } | {"samples": len(samples)}
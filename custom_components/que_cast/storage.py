@@ -0,0 +1,164 @@
+"""Queue persistence for Que Cast."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+JOURNAL_FLUSH_DELAY = 1.0
+# Journal length at which it is folded into a fresh snapshot
+COMPACT_AFTER = 500
+
+
+class QueCastQueueStore:
+    """Snapshot plus append-only journal of one instance's queue.
+
+    Every change is recorded as a journal op (``put`` an item, ``del`` an
+    item id, ``clear``). Ops are buffered and appended in one write per
+    ``JOURNAL_FLUSH_DELAY`` so enqueue bursts cost a single disk write; once
+    the journal grows past ``COMPACT_AFTER`` ops it is replaced by a snapshot.
+    Replaying the journal over the snapshot rebuilds the queue on start.
+    Item ids restart with every process, so nothing is written before the
+    persisted queue is loaded; ops recorded earlier are held back until
+    then and are superseded by the snapshot taken after the restore.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        instance_id: str,
+        snapshot: Callable[[], list[dict[str, Any]]],
+    ):
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{instance_id}.queue")
+        self._journal_path = hass.config.path(STORAGE_DIR, f"{DOMAIN}.{instance_id}.queue.journal")
+        self._snapshot = snapshot
+
+        self._pending: list[str] = []
+        self._journal_len = 0
+        self._loaded = False
+        # Serializes journal appends against compaction truncating the file
+        self._io_lock = asyncio.Lock()
+        self._unsub_flush: Optional[CALLBACK_TYPE] = None
+        self._unsub_final_write: Optional[CALLBACK_TYPE] = None
+
+    async def async_load(self) -> list[dict[str, Any]]:
+        """Return the persisted items in playback order."""
+        data = await self._store.async_load() or {}
+        items: dict[int, dict[str, Any]] = {item["id"]: item for item in data.get("items", [])}
+        for op in await self._hass.async_add_executor_job(self._read_journal):
+            if op[0] == "put":
+                items[op[1]["id"]] = op[1]
+            elif op[0] == "del":
+                items.pop(op[1], None)
+            elif op[0] == "clear":
+                items.clear()
+
+        self._unsub_final_write = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
+        self._loaded = True
+        return list(items.values())
+
+    def _read_journal(self) -> list[list]:
+        ops = []
+        try:
+            with open(self._journal_path, encoding="utf-8") as fp:
+                for line in fp:
+                    try:
+                        ops.append(json.loads(line))
+                    except ValueError:
+                        # A torn final line from a crash mid-write
+                        _LOGGER.debug("Skipping unreadable journal line")
+        except FileNotFoundError:
+            pass
+        self._journal_len = len(ops)
+        return ops
+
+    @callback
+    def put(self, item: dict[str, Any]) -> None:
+        self._record(["put", item])
+
+    @callback
+    def delete(self, item_id: int) -> None:
+        self._record(["del", item_id])
+
+    @callback
+    def clear(self) -> None:
+        self._record(["clear"])
+
+    def _record(self, op: list) -> None:
+        self._pending.append(json.dumps(op))
+        if self._loaded and self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self._hass, JOURNAL_FLUSH_DELAY, self._async_flush)
+
+    async def _async_flush(self, _now: datetime | None = None) -> None:
+        self._unsub_flush = None
+        if self._journal_len + len(self._pending) > COMPACT_AFTER:
+            await self.async_compact()
+            return
+        async with self._io_lock:
+            if not self._pending:
+                return
+            lines, self._pending = self._pending, []
+            self._journal_len += len(lines)
+            await self._hass.async_add_executor_job(self._append, lines)
+
+    def _append(self, lines: list[str]) -> None:
+        with open(self._journal_path, "a", encoding="utf-8") as fp:
+            fp.write("\n".join(lines) + "\n")
+
+    async def async_compact(self) -> None:
+        """Write the current queue as a snapshot and start an empty journal."""
+        if not self._loaded:
+            # It would overwrite the persisted queue before it was restored
+            return
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        async with self._io_lock:
+            # The snapshot supersedes every op recorded so far
+            self._pending.clear()
+            await self._store.async_save({"items": self._snapshot()})
+            self._journal_len = 0
+            await self._hass.async_add_executor_job(self._truncate)
+
+    def _truncate(self) -> None:
+        try:
+            os.remove(self._journal_path)
+        except FileNotFoundError:
+            pass
+
+    async def async_close(self) -> None:
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        await self.async_compact()
+
+    async def async_remove(self) -> None:
+        """Delete the snapshot and the journal of a removed instance."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        async with self._io_lock:
+            self._pending.clear()
+            await self._store.async_remove()
+            self._journal_len = 0
+            await self._hass.async_add_executor_job(self._truncate)
+
+    async def _async_final_write(self, _event: Event) -> None:
+        self._unsub_final_write = None
+        await self.async_compact()
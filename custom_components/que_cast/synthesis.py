@@ -0,0 +1,117 @@
+"""TTS synthesis helpers for Que Cast."""
+from __future__ import annotations
+
+import logging
+import os
+from typing import Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from homeassistant.components import media_source, tts
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+_LOGGER = logging.getLogger(__name__)
+
+FETCH_TIMEOUT = 10
+
+
+def split_engine(engine: str) -> tuple[str, str]:
+    """Parse engine "tts.speak" -> domain="tts", service="speak"."""
+    if "." in engine:
+        domain, service = engine.split(".", 1)
+        return domain, service
+    return "tts", engine
+
+
+def tts_engine_id(service: str, options: dict) -> Optional[str]:
+    """Return the TTS engine a service call would use.
+
+    'tts.speak' targets a TTS entity through 'entity_id' in the options;
+    legacy '<platform>_say' services map to the platform name.
+    """
+    if service == "speak":
+        return options.get("entity_id")
+    if service.endswith("_say"):
+        return service[: -len("_say")]
+    return None
+
+
+def _media_source_id(
+    hass: HomeAssistant,
+    engine: str,
+    message: str,
+    language: Optional[str],
+    options: dict,
+) -> Optional[str]:
+    _, service = split_engine(engine)
+    engine_id = tts_engine_id(service, options)
+    if engine_id is None:
+        return None
+    return tts.generate_media_source_id(
+        hass,
+        message,
+        engine=engine_id,
+        language=language or options.get("language"),
+        options=options.get("options"),
+        cache=False,
+    )
+
+
+async def async_resolve_media_url(
+    hass: HomeAssistant,
+    engine: str,
+    message: str,
+    language: Optional[str],
+    options: dict,
+    media_player: str,
+) -> Optional[str]:
+    """Synthesize a message and return its (unsigned) TTS proxy URL."""
+    media_id = _media_source_id(hass, engine, message, language, options)
+    if media_id is None:
+        return None
+    # Resolving a TTS media source runs the synthesis
+    resolved = await media_source.async_resolve_media(hass, media_id, media_player)
+    return resolved.url
+
+
+async def async_synthesize(
+    hass: HomeAssistant,
+    engine: str,
+    message: str,
+    language: Optional[str],
+    options: dict,
+) -> Optional[tuple[str, bytes]]:
+    """Synthesize a message and return (extension, audio bytes)."""
+    media_id = _media_source_id(hass, engine, message, language, options)
+    if media_id is None:
+        return None
+    return await tts.async_get_media_source_audio(hass, media_id)
+
+
+async def async_fetch_audio(hass: HomeAssistant, url: str) -> Optional[tuple[str, bytes]]:
+    """Fetch an audio file given as an http(s) URL or a /local/ path.
+
+    Returns (extension, audio bytes), or None for other kinds of URL such as
+    media source ids.
+    """
+    parsed = urlparse(url)
+    extension = os.path.splitext(parsed.path)[1][1:].lower()
+    if parsed.scheme in ("http", "https"):
+        session = async_get_clientsession(hass)
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT)) as resp:
+            resp.raise_for_status()
+            return extension, await resp.read()
+    if not parsed.scheme and parsed.path.startswith("/local/"):
+        www = hass.config.path("www")
+        path = os.path.normpath(os.path.join(www, parsed.path[len("/local/"):]))
+        if not path.startswith(www + os.sep):
+            return None
+
+        def _read() -> bytes:
+            with open(path, "rb") as fp:
+                return fp.read()
+
+        return extension, await hass.async_add_executor_job(_read)
+    return None
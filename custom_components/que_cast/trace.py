@@ -0,0 +1,61 @@
+"""Recent item lifecycle traces for Que Cast."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from time import monotonic, time
+from typing import Any, Awaitable, Optional, TypeVar
+
+from homeassistant.util import dt as dt_util
+
+# Events kept per instance
+TRACE_SIZE = 200
+
+_T = TypeVar("_T")
+
+
+class QueCastTrace:
+    """Ring buffer of the last lifecycle events of one instance's items.
+
+    Recording only appends a tuple; events become dicts when the trace is
+    exported through diagnostics or the get_trace service.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        # (epoch seconds, item id, event, details)
+        self._events: deque[tuple[float, Optional[int], str, dict[str, Any]]] = deque(maxlen=size)
+
+    def record(self, item_id: Optional[int], event: str, **details: Any) -> None:
+        self._events.append((time(), item_id, event, details))
+
+    async def async_call(self, item_id: Optional[int], call: str, awaitable: Awaitable[_T]) -> _T:
+        """Await a service call, recording its duration and outcome."""
+        start = monotonic()
+        try:
+            result = await awaitable
+        except asyncio.CancelledError:
+            self._record_call(item_id, call, start, "cancelled")
+            raise
+        except Exception as err:
+            self._record_call(item_id, call, start, f"error: {err}")
+            raise
+        self._record_call(item_id, call, start, "ok")
+        return result
+
+    def _record_call(self, item_id: Optional[int], call: str, start: float, result: str) -> None:
+        self.record(item_id, "call", call=call, ms=round((monotonic() - start) * 1000, 1), result=result)
+
+    def as_list(self, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """Return the recorded events, oldest first; the newest limit if given."""
+        events = list(self._events)
+        if limit is not None:
+            events = events[-limit:] if limit else []
+        return [
+            {
+                "time": dt_util.utc_from_timestamp(when).isoformat(),
+                "item": item_id,
+                "event": event,
+                **details,
+            }
+            for when, item_id, event, details in events
+        ]
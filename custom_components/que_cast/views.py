@@ -0,0 +1,31 @@
+"""HTTP views for Que Cast."""
+from __future__ import annotations
+
+from http import HTTPStatus
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+AUDIO_URL = "/api/que_cast/audio/{instance_id}/{filename}"
+
+
+class QueCastAudioView(HomeAssistantView):
+    """Serve cached announcement audio to media players."""
+
+    url = AUDIO_URL
+    name = "api:que_cast:audio"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+
+    async def get(self, request: web.Request, instance_id: str, filename: str) -> web.StreamResponse:
+        data = self._hass.data[DOMAIN].get(instance_id)
+        cache = data["queue_manager"].audio_cache if data else None
+        path = cache.path(filename) if cache else None
+        if path is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.FileResponse(path)